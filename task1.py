@@ -3,10 +3,38 @@
 
 Реалізація:
 1. Функція реверсування однозв'язного списку
-2. Алгоритм сортування злиттям для однозв'язного списку
+2. Алгоритм сортування злиттям для однозв'язного списку (ітеративний)
 3. Функція об'єднання двох відсортованих однозв'язних списків
+4. Компактний однозв'язний список на типізованих масивах (ArrayLinkedList)
+5. Злиття k відсортованих списків через купу (merge_k_sorted_linked_lists)
+6. Зовнішнє сортування злиттям для даних, що не вміщуються в пам'ять
+7. Паралельне сортування злиттям на пулі процесів
+8. Індекс skip-list над відсортованим списком (SkipListIndex)
+9. Бінарні знімки списків із завантаженням через mmap
 """
 
+import heapq
+import mmap
+import operator
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from itertools import islice
+
+# Порожнє посилання в ArrayLinkedList (аналог None для Node.next)
+NIL = -1
+
+# Заголовок бінарного знімка: сигнатура, тип значень, кількість значень
+SNAPSHOT_MAGIC = b"LLS1"
+SNAPSHOT_HEADER = struct.Struct("<4sc3xQ")
+
 
 class Node:
     """Клас вузла однозв'язного списку"""
@@ -21,41 +49,561 @@ class LinkedList:
 
     def __init__(self):
         self.head = None
+        self.tail = None  # Останній вузол для вставки в кінець за O(1)
+        self.size = 0  # Кількість вузлів у списку
+        self.index = None  # Необов'язковий SkipListIndex над відсортованим списком
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Створення списку з ітерованого об'єкта за один прохід"""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
 
     def insert_at_beginning(self, data):
         """Вставка вузла на початок списку"""
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.size += 1
 
     def insert_at_end(self, data):
-        """Вставка вузла в кінець списку"""
+        """Вставка вузла в кінець списку за O(1)"""
         new_node = Node(data)
         if self.head is None:
             self.head = new_node
         else:
-            cur = self.head
-            while cur.next:
-                cur = cur.next
-            cur.next = new_node
+            self.tail.next = new_node
+        self.tail = new_node
+        self.size += 1
+
+    def extend(self, iterable):
+        """
+        Додавання всіх елементів ітерованого об'єкта в кінець списку.
+        Нові вузли зв'язуються в окремий ланцюжок і приєднуються одним кроком.
+        """
+        sentinel = Node()
+        tail = sentinel
+        count = 0
+        for data in iterable:
+            node = Node(data)
+            tail.next = node
+            tail = node
+            count += 1
+
+        if count == 0:
+            return
+
+        if self.head is None:
+            self.head = sentinel.next
+        else:
+            self.tail.next = sentinel.next
+        self.tail = tail
+        self.size += count
 
-    def print_list(self):
-        """Виведення списку"""
+    def __iter__(self):
+        """Потоковий обхід значень списку без створення проміжного списку"""
         current = self.head
-        elements = []
-        while current:
-            elements.append(str(current.data))
+        while current is not None:
+            yield current.data
             current = current.next
-        print(" -> ".join(elements) if elements else "Порожній список")
+
+    def __len__(self):
+        """Кількість вузлів у списку за O(1)"""
+        return self.size
+
+    def islice(self, *args):
+        """Ітератор по зрізу списку, аргументи як у itertools.islice"""
+        return islice(self, *args)
+
+    def print_list(self, file=None, chunk_size=1000, max_items=None):
+        """
+        Виведення списку.
+
+        Args:
+            file: файлоподібний об'єкт для виводу (None - sys.stdout)
+            chunk_size: кількість елементів, що записуються за один раз
+            max_items: якщо список довший, виводяться лише початок і кінець
+        """
+        _print_values(self, self.size, file, chunk_size, max_items)
 
     def to_list(self):
         """Конвертація в Python список для тестування"""
-        result = []
+        return list(self)
+
+    def save(self, path, typecode="q"):
+        """
+        Збереження числових значень списку в бінарний файл.
+
+        Args:
+            path: шлях до файлу
+            typecode: тип значень ("q" - цілі, "d" - дійсні)
+        """
+        _write_snapshot(path, self, typecode)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Завантаження списку з бінарного знімка.
+
+        Args:
+            path: шлях до файлу, створеного save
+            mmap: читати файл через відображення в пам'ять
+
+        Returns:
+            LinkedList: новий список
+        """
+        return cls.from_iterable(_read_snapshot(path, mmap))
+
+
+class ArrayLinkedList:
+    """
+    Однозв'язний список на паралельних типізованих масивах.
+
+    Замість об'єктів Node значення зберігаються в масиві values, а посилання
+    на наступний вузол - в масиві links (індекс або NIL). Звільнені комірки
+    об'єднуються у список вільних комірок і використовуються повторно.
+    """
+
+    def __init__(self, typecode="q"):
+        self.typecode = typecode  # Тип значень: "q" - цілі, "d" - дійсні
+        self.values = array(typecode)
+        self.links = array("q")
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+        self.free = NIL  # Голова списку вільних комірок
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode="q"):
+        """Створення списку з ітерованого об'єкта за один прохід"""
+        linked_list = cls(typecode)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _allocate(self, data):
+        """Повертає індекс комірки для нового вузла"""
+        index = self.free
+        if index != NIL:
+            self.values[index] = data  # Спершу запис: невдалий не зачепить free
+            self.free = self.links[index]
+            self.links[index] = NIL
+        else:
+            index = len(self.values)
+            self.values.append(data)
+            self.links.append(NIL)
+        return index
+
+    def insert_at_beginning(self, data):
+        """Вставка вузла на початок списку"""
+        index = self._allocate(data)
+        self.links[index] = self.head
+        self.head = index
+        if self.tail == NIL:
+            self.tail = index
+        self.size += 1
+
+    def insert_at_end(self, data):
+        """Вставка вузла в кінець списку за O(1)"""
+        index = self._allocate(data)
+        if self.head == NIL:
+            self.head = index
+        else:
+            self.links[self.tail] = index
+        self.tail = index
+        self.size += 1
+
+    def extend(self, iterable):
+        """
+        Додавання всіх елементів ітерованого об'єкта в кінець списку.
+        Якщо вільних комірок немає, нові вузли дописуються суцільним блоком.
+        """
+        if self.free != NIL:
+            for data in iterable:
+                self.insert_at_end(data)
+            return
+
+        # Спершу тимчасовий масив: якщо елемент невалідний, список не змінюється
+        block = array(self.typecode, iterable)
+        if not block:
+            return
+        start = len(self.values)
+        self.values.extend(block)
+        stop = len(self.values)
+
+        # Кожен новий вузол посилається на сусідню комірку
+        self.links.extend(range(start + 1, stop + 1))
+        self.links[stop - 1] = NIL
+        if self.head == NIL:
+            self.head = start
+        else:
+            self.links[self.tail] = start
+        self.tail = stop - 1
+        self.size += stop - start
+
+    def remove(self, data):
+        """
+        Видалення першого вузла зі значенням data.
+        Комірка вузла повертається до списку вільних комірок.
+
+        Returns:
+            bool: True, якщо вузол знайдено та видалено
+        """
+        links = self.links
+        values = self.values
+        prev = NIL
         current = self.head
-        while current:
-            result.append(current.data)
-            current = current.next
-        return result
+        while current != NIL and values[current] != data:
+            prev = current
+            current = links[current]
+
+        if current == NIL:
+            return False
+
+        if prev == NIL:
+            self.head = links[current]
+        else:
+            links[prev] = links[current]
+        if self.tail == current:
+            self.tail = prev
+
+        links[current] = self.free
+        self.free = current
+        self.size -= 1
+        return True
+
+    def __iter__(self):
+        """Потоковий обхід значень списку за індексними посиланнями"""
+        values = self.values
+        links = self.links
+        current = self.head
+        while current != NIL:
+            yield values[current]
+            current = links[current]
+
+    def __len__(self):
+        """Кількість вузлів у списку за O(1)"""
+        return self.size
+
+    def islice(self, *args):
+        """Ітератор по зрізу списку, аргументи як у itertools.islice"""
+        return islice(self, *args)
+
+    def print_list(self, file=None, chunk_size=1000, max_items=None):
+        """Виведення списку (параметри як у LinkedList.print_list)"""
+        _print_values(self, self.size, file, chunk_size, max_items)
+
+    def to_list(self):
+        """Конвертація в Python список для тестування"""
+        return list(self)
+
+    def save(self, path):
+        """Збереження значень списку в бінарний файл (у логічному порядку)"""
+        _write_snapshot(path, self, self.typecode)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """
+        Завантаження списку з бінарного знімка.
+
+        Буфер значень копіюється в масив values одним блоком, а посилання
+        будуються як суцільна послідовність комірок, без створення вузлів.
+
+        Args:
+            path: шлях до файлу, створеного save
+            mmap: читати файл через відображення в пам'ять
+
+        Returns:
+            ArrayLinkedList: новий список
+        """
+        values = _read_snapshot(path, mmap)
+        linked_list = cls(values.typecode)
+        linked_list.values = values
+        size = len(values)
+        if size:
+            linked_list.links = array("q", range(1, size + 1))
+            linked_list.links[size - 1] = NIL
+            linked_list.head = 0
+            linked_list.tail = size - 1
+            linked_list.size = size
+        return linked_list
+
+
+def _write_snapshot(path, values, typecode):
+    """
+    Записує знімок: заголовок SNAPSHOT_HEADER і значення фіксованої ширини
+    у порядку little-endian.
+    """
+    buffer = array(typecode, values)
+    if sys.byteorder != "little":
+        buffer.byteswap()
+    with open(path, "wb") as file:
+        file.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, typecode.encode(), len(buffer)))
+        buffer.tofile(file)
+
+
+def _read_snapshot(path, use_mmap=True):
+    """
+    Читає знімок у масив array.
+
+    Raises:
+        ValueError: якщо файл не є знімком або пошкоджений
+    """
+    with open(path, "rb") as file:
+        if use_mmap and os.fstat(file.fileno()).st_size > 0:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = file.read()
+
+        try:
+            if len(buffer) < SNAPSHOT_HEADER.size:
+                raise ValueError(f"{path}: файл занадто короткий для знімка")
+            magic, typecode, count = SNAPSHOT_HEADER.unpack_from(buffer)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path}: невідомий формат файлу")
+
+            values = array(typecode.decode())
+            end = SNAPSHOT_HEADER.size + count * values.itemsize
+            if len(buffer) < end:
+                raise ValueError(f"{path}: файл обрізано")
+
+            # Копіюємо значення одним блоком прямо з буфера
+            with memoryview(buffer) as view:
+                values.frombytes(view[SNAPSHOT_HEADER.size : end])
+        finally:
+            if isinstance(buffer, mmap.mmap):
+                buffer.close()
+
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+def _print_values(values, size, file, chunk_size, max_items):
+    """
+    Потокове виведення значень у форматі "a -> b -> c".
+
+    Значення записуються частинами по chunk_size, тому перший байт виводу
+    з'являється одразу, а пам'ять не залежить від довжини списку. Якщо
+    size > max_items, виводиться початок і кінець списку через "...".
+    """
+    if file is None:
+        file = sys.stdout
+    if size == 0:
+        file.write("Порожній список\n")
+        return
+
+    iterator = iter(values)
+    if max_items is not None and size > max_items:
+        head_count = (max_items + 1) // 2
+        head = [str(value) for value in islice(iterator, head_count)]
+        # Кінець списку: зберігаємо лише останні значення під час обходу
+        tail = deque(iterator, maxlen=max_items - head_count)
+        parts = head + ["..."] + [str(value) for value in tail]
+        file.write(" -> ".join(parts))
+        file.write(f" (усього {size})\n")
+        return
+
+    separator = ""
+    while True:
+        chunk = [str(value) for value in islice(iterator, chunk_size)]
+        if not chunk:
+            break
+        file.write(separator + " -> ".join(chunk))
+        separator = " -> "
+    file.write("\n")
+
+
+class _SkipEntry:
+    """Запис рівня індексу: посилання на вузол, наступний запис і запис нижче"""
+
+    __slots__ = ("node", "next", "down")
+
+    def __init__(self, node, next_entry=None, down=None):
+        self.node = node
+        self.next = next_entry
+        self.down = down
+
+
+class SkipListIndex:
+    """
+    Індекс skip-list над відсортованим LinkedList.
+
+    Нижнім рівнем є самі вузли списку, а над ними будуються рівні записів
+    _SkipEntry з посиланнями на вузли. Кожен вузол потрапляє на рівень
+    вище з імовірністю probability, тому пошук, вставка та видалення
+    мають очікувану складність O(log n).
+
+    Індекс дійсний, доки список змінюється лише через його методи.
+    reverse_linked_list та merge_sort_linked_list скидають linked_list.index,
+    а merge_two_sorted_linked_lists будує індекс для результату.
+    """
+
+    MAX_LEVEL = 32
+
+    def __init__(self, linked_list, probability=0.5, seed=None):
+        self.linked_list = linked_list
+        self.probability = probability
+        self.random = random.Random(seed)
+        self.heads = []  # heads[i] - перший запис рівня i
+        self._build()
+        linked_list.index = self
+
+    def _random_height(self):
+        """Кількість рівнів індексу для нового вузла"""
+        height = 0
+        while height < self.MAX_LEVEL and self.random.random() < self.probability:
+            height += 1
+        return height
+
+    def _build(self):
+        """Побудова рівнів за один прохід по відсортованому списку"""
+        heads = self.heads
+        last = []  # Останній запис на кожному рівні
+        node = self.linked_list.head
+        while node is not None:
+            down = None
+            for level in range(self._random_height()):
+                entry = _SkipEntry(node, None, down)
+                if level == len(heads):
+                    heads.append(entry)
+                    last.append(entry)
+                else:
+                    last[level].next = entry
+                    last[level] = entry
+                down = entry
+            node = node.next
+
+    def _find_predecessors(self, value, inclusive=False):
+        """
+        Пошук попередників для значення на кожному рівні.
+
+        Args:
+            value: шукане значення
+            inclusive: якщо True, проходимо і через рівні значення
+                       (позиція вставки після них)
+
+        Returns:
+            tuple: (попередні записи для кожного рівня або None,
+                    попередній вузол нижнього рівня або None)
+        """
+        before = operator.le if inclusive else operator.lt
+        update = [None] * len(self.heads)
+        entry = None
+
+        for level in range(len(self.heads) - 1, -1, -1):
+            candidate = self.heads[level] if entry is None else entry.next
+            while candidate is not None and before(candidate.node.data, value):
+                entry = candidate
+                candidate = entry.next
+            update[level] = entry
+            if level and entry is not None:
+                entry = entry.down
+
+        # Прохід нижнім рівнем - самими вузлами списку
+        node = entry.node if entry is not None else None
+        candidate = self.linked_list.head if node is None else node.next
+        while candidate is not None and before(candidate.data, value):
+            node = candidate
+            candidate = node.next
+        return update, node
+
+    def find(self, value):
+        """
+        Пошук першого вузла зі значенням value за O(log n).
+
+        Returns:
+            Node або None
+        """
+        _, prev = self._find_predecessors(value)
+        candidate = self.linked_list.head if prev is None else prev.next
+        if candidate is not None and candidate.data == value:
+            return candidate
+        return None
+
+    def __contains__(self, value):
+        return self.find(value) is not None
+
+    def insert_sorted(self, data):
+        """
+        Вставка значення зі збереженням порядку (після рівних значень).
+
+        Returns:
+            Node: новий вузол
+        """
+        linked_list = self.linked_list
+        update, prev = self._find_predecessors(data, inclusive=True)
+
+        node = Node(data)
+        if prev is None:
+            node.next = linked_list.head
+            linked_list.head = node
+        else:
+            node.next = prev.next
+            prev.next = node
+        if node.next is None:
+            linked_list.tail = node
+        linked_list.size += 1
+
+        down = None
+        for level in range(self._random_height()):
+            entry = _SkipEntry(node, None, down)
+            if level == len(self.heads):
+                self.heads.append(entry)
+            elif update[level] is None:
+                entry.next = self.heads[level]
+                self.heads[level] = entry
+            else:
+                entry.next = update[level].next
+                update[level].next = entry
+            down = entry
+        return node
+
+    def delete(self, value):
+        """
+        Видалення першого вузла зі значенням value.
+
+        Returns:
+            bool: True, якщо вузол знайдено та видалено
+        """
+        linked_list = self.linked_list
+        update, prev = self._find_predecessors(value)
+        target = linked_list.head if prev is None else prev.next
+        if target is None or target.data != value:
+            return False
+
+        if prev is None:
+            linked_list.head = target.next
+        else:
+            prev.next = target.next
+        if linked_list.tail is target:
+            linked_list.tail = prev
+        linked_list.size -= 1
+
+        # Прибираємо записи вузла знизу вгору, доки вони є
+        for level in range(len(self.heads)):
+            entry = update[level]
+            candidate = self.heads[level] if entry is None else entry.next
+            if candidate is None or candidate.node is not target:
+                break
+            if entry is None:
+                self.heads[level] = candidate.next
+            else:
+                entry.next = candidate.next
+
+        while self.heads and self.heads[-1] is None:
+            self.heads.pop()
+        return True
+
+    def iter_range(self, low, high):
+        """Ітератор значень з проміжку low <= value <= high за зростанням"""
+        _, prev = self._find_predecessors(low)
+        node = self.linked_list.head if prev is None else prev.next
+        while node is not None and node.data <= high:
+            yield node.data
+            node = node.next
 
 
 def reverse_linked_list(linked_list):
@@ -69,13 +617,17 @@ def reverse_linked_list(linked_list):
     - Складність: O(n) за часом, O(1) за пам'яттю
 
     Args:
-        linked_list: LinkedList об'єкт для реверсування
+        linked_list: LinkedList або ArrayLinkedList для реверсування
 
     Returns:
         LinkedList: реверсований список
     """
+    if isinstance(linked_list, ArrayLinkedList):
+        return _reverse_array_list(linked_list)
+
     prev = None
     current = linked_list.head
+    linked_list.tail = current  # Колишня голова стає хвостом
 
     while current:
         next_node = current.next  # Зберігаємо наступний вузол
@@ -84,88 +636,198 @@ def reverse_linked_list(linked_list):
         current = next_node  # Переміщуємо current вперед
 
     linked_list.head = prev  # Оновлюємо голову списку
+    linked_list.index = None  # Порядок змінився, індекс більше не дійсний
     return linked_list
 
 
-def merge_sort_linked_list(linked_list):
+def merge_sort_linked_list(linked_list, key=None, reverse=False):
     """
     Сортування однозв'язного списку методом злиття (Merge Sort).
 
-    Алгоритм:
-    - Рекурсивно ділимо список на дві половини
-    - Сортуємо кожну половину
-    - Зливаємо відсортовані половини
-    - Складність: O(n log n) за часом, O(log n) за пам'яттю (рекурсія)
+    Алгоритм (ітеративне природне сортування злиттям, знизу вгору):
+    - Проходимо по списку та виділяємо природні неспадні серії (runs)
+    - Зливаємо сусідні серії попарно, отримуючи вдвічі менше серій
+    - Повторюємо проходи, доки не залишиться одна серія
+    - Складність: O(n log r) за часом, де r - кількість початкових серій
+      (для вже відсортованого списку - один прохід O(n)),
+      O(1) за пам'яттю, без рекурсії
+    - Сортування стабільне: рівні елементи зберігають початковий порядок
+
+    Якщо задано key, ключ кожного вузла обчислюється рівно один раз
+    (decorate-sort-undecorate): сортується тимчасовий ланцюжок вузлів
+    з ключами, кожен з яких посилається на вузол списку, а вузли списку
+    перезв'язуються лише після успішного сортування. data не змінюється,
+    і якщо key або порівняння ключів кидає виняток, список лишається як був.
 
     Args:
-        linked_list: LinkedList об'єкт для сортування
+        linked_list: LinkedList або ArrayLinkedList для сортування
+        key: функція, що повертає ключ порівняння для значення
+        reverse: якщо True, сортування за спаданням (також стабільне)
 
     Returns:
         LinkedList: відсортований список
     """
+    if isinstance(linked_list, ArrayLinkedList):
+        return _merge_sort_array_list(linked_list, key, reverse)
+
     if linked_list.head is None:
         return linked_list
 
-    linked_list.head = _merge_sort_recursive(linked_list.head)
+    if key is not None:
+        keyed = _decorate(linked_list, key)
+        merge_sort_linked_list(keyed, reverse=reverse)
+        _undecorate(linked_list, keyed)
+        return linked_list
+
+    linked_list.index = None
+    # Стабільне сортування за спаданням: реверс, сортування, реверс
+    if reverse:
+        reverse_linked_list(linked_list)
+    linked_list.head, linked_list.tail = _merge_sort_iterative(linked_list.head)
+    if reverse:
+        reverse_linked_list(linked_list)
     return linked_list
 
 
-def _merge_sort_recursive(head):
+def _decorate(linked_list, key):
+    """
+    Будує тимчасовий LinkedList з ключів: вузол з ключем у data посилається
+    на вузол початкового списку через атрибут origin.
     """
-    Рекурсивна функція для сортування злиттям.
+    keyed = LinkedList()
+    tail = sentinel = Node()
+    node = linked_list.head
+    while node is not None:
+        tail.next = Node(key(node.data))
+        tail = tail.next
+        tail.origin = node
+        node = node.next
+    keyed.head, keyed.tail, keyed.size = sentinel.next, tail, linked_list.size
+    return keyed
+
+
+def _undecorate(linked_list, keyed):
+    """Перезв'язує вузли списку в порядку відсортованих ключів"""
+    tail = sentinel = Node()
+    node = keyed.head
+    while node is not None:
+        tail.next = node.origin
+        tail = tail.next
+        node = node.next
+    tail.next = None
+    linked_list.head, linked_list.tail = sentinel.next, tail
+    linked_list.index = None
+
+
+def _merge_sort_iterative(head):
+    """
+    Ітеративне сортування злиттям природних серій.
 
     Args:
         head: Node - початок списку
 
     Returns:
-        Node: початок відсортованого списку
+        tuple: (голова, хвіст) відсортованого списку
     """
-    # Базовий випадок: якщо список порожній або містить один елемент
-    if head is None or head.next is None:
-        return head
+    sentinel = Node()
+
+    while True:
+        tail = sentinel
+        runs = 0
+        current = head
 
-    # Ділимо список на дві половини
-    middle = _get_middle(head)
-    next_to_middle = middle.next
-    middle.next = None
+        while current is not None:
+            # Відрізаємо першу серію
+            left = current
+            left_tail = _cut_run(left)
+            right = left_tail.next
+            left_tail.next = None
+            runs += 1
 
-    # Рекурсивно сортуємо обидві половини
-    left = _merge_sort_recursive(head)
-    right = _merge_sort_recursive(next_to_middle)
+            # Непарна остання серія переходить у наступний прохід без змін
+            if right is None:
+                tail.next = left
+                tail = left_tail
+                break
 
-    # Зливаємо відсортовані половини
-    sorted_list = _merge_two_sorted_lists(left, right)
-    return sorted_list
+            # Відрізаємо другу серію та зливаємо обидві
+            right_tail = _cut_run(right)
+            current = right_tail.next
+            right_tail.next = None
 
+            merged_head, merged_tail = _merge_runs(left, left_tail, right, right_tail)
+            tail.next = merged_head
+            tail = merged_tail
 
-def _get_middle(head):
+        head = sentinel.next
+        sentinel.next = None
+
+        # Одна серія на проході означає, що список відсортований
+        if runs <= 1:
+            return head, tail
+
+
+def _cut_run(head):
     """
-    Знаходить середній вузол списку використовуючи техніку двох покажчиків.
-    Повільний покажчик рухається на 1 крок, швидкий - на 2 кроки.
+    Знаходить кінець неспадної серії, що починається з head.
 
     Args:
-        head: Node - початок списку
+        head: Node - початок серії
 
     Returns:
-        Node: середній вузол
+        Node: останній вузол серії
     """
-    if head is None:
-        return head
+    current = head
+    next_node = current.next
+    while next_node is not None and current.data <= next_node.data:
+        current = next_node
+        next_node = current.next
+    return current
 
-    slow = head
-    fast = head
 
-    while fast.next and fast.next.next:
-        slow = slow.next
-        fast = fast.next.next
+def _merge_runs(left, left_tail, right, right_tail):
+    """
+    Зливає дві відсортовані серії та повертає голову і хвіст результату.
 
-    return slow
+    Args:
+        left: Node - початок першої серії
+        left_tail: Node - кінець першої серії
+        right: Node - початок другої серії
+        right_tail: Node - кінець другої серії
+
+    Returns:
+        tuple: (голова, хвіст) об'єднаної серії
+    """
+    # Швидкий шлях: серії вже йдуть одна за одною
+    if left_tail.data <= right.data:
+        left_tail.next = right
+        return left, right_tail
+
+    sentinel = Node()
+    tail = sentinel
+
+    while left is not None and right is not None:
+        if left.data <= right.data:
+            tail.next = left
+            tail = left
+            left = left.next
+        else:
+            tail.next = right
+            tail = right
+            right = right.next
+
+    # Приєднуємо залишок однієї з серій
+    if left is not None:
+        tail.next = left
+        return sentinel.next, left_tail
+    tail.next = right
+    return sentinel.next, right_tail
 
 
 def _merge_two_sorted_lists(left, right):
     """
     Зливає два відсортовані списки в один відсортований.
-    Допоміжна функція для merge sort.
+    Ітеративна версія: без рекурсії, O(1) додаткової пам'яті.
 
     Args:
         left: Node - перший відсортований список
@@ -180,15 +842,22 @@ def _merge_two_sorted_lists(left, right):
     if right is None:
         return left
 
-    # Вибираємо менший елемент як початок результату
-    if left.data <= right.data:
-        result = left
-        result.next = _merge_two_sorted_lists(left.next, right)
-    else:
-        result = right
-        result.next = _merge_two_sorted_lists(left, right.next)
+    sentinel = Node()
+    tail = sentinel
 
-    return result
+    # Щоразу приєднуємо менший елемент (при рівності - з лівого списку)
+    while left is not None and right is not None:
+        if left.data <= right.data:
+            tail.next = left
+            tail = left
+            left = left.next
+        else:
+            tail.next = right
+            tail = right
+            right = right.next
+
+    tail.next = left if left is not None else right
+    return sentinel.next
 
 
 def merge_two_sorted_linked_lists(list1, list2):
@@ -199,37 +868,715 @@ def merge_two_sorted_linked_lists(list1, list2):
     - Використовуємо два покажчики для проходу по обох списках
     - Порівнюємо елементи та додаємо менший до результату
     - Складність: O(n + m) за часом, O(1) за пам'яттю
+    - Вузли переносяться без копіювання, тому list1 та list2 після
+      виклику стають порожніми
 
     Args:
         list1: LinkedList - перший відсортований список
         list2: LinkedList - другий відсортований список
 
+    Якщо обидва списки - ArrayLinkedList, результат теж ArrayLinkedList;
+    для змішаних типів ArrayLinkedList перетворюється на LinkedList.
+
     Returns:
         LinkedList: об'єднаний відсортований список
     """
+    if isinstance(list1, ArrayLinkedList) and isinstance(list2, ArrayLinkedList):
+        return _merge_two_sorted_array_lists(list1, list2)
+    list1, list2 = _as_node_list(list1), _as_node_list(list2)
+
     # Створюємо новий список для результату
     merged_list = LinkedList()
-
-    # Якщо обидва списки порожні
-    if list1.head is None and list2.head is None:
-        return merged_list
+    merged_list.size = list1.size + list2.size
 
     # Якщо один зі списків порожній
     if list1.head is None:
-        merged_list.head = list2.head
-        return merged_list
-    if list2.head is None:
-        merged_list.head = list1.head
+        merged_list.head, merged_list.tail = list2.head, list2.tail
+    elif list2.head is None:
+        merged_list.head, merged_list.tail = list1.head, list1.tail
+    else:
+        # Використовуємо допоміжну функцію для злиття
+        merged_list.head = _merge_two_sorted_lists(list1.head, list2.head)
+        # Хвостом стає більший з двох хвостів (при рівності - з другого списку)
+        if list1.tail.data <= list2.tail.data:
+            merged_list.tail = list2.tail
+        else:
+            merged_list.tail = list1.tail
+
+    # Якщо хоча б один зі списків мав індекс, індексуємо і результат
+    if list1.index is not None or list2.index is not None:
+        SkipListIndex(merged_list)
+
+    # Вузли перенесено до нового списку, вхідні списки стають порожніми
+    _clear(list1)
+    _clear(list2)
+
+    return merged_list
+
+
+def _as_node_list(linked_list):
+    """
+    Перетворює ArrayLinkedList на LinkedList з тими самими значеннями
+    (вхідний список спорожнюється, як і при злитті); LinkedList - без змін.
+    """
+    if not isinstance(linked_list, ArrayLinkedList):
+        return linked_list
+    converted = LinkedList.from_iterable(linked_list)
+    linked_list.__init__(linked_list.typecode)
+    return converted
+
+
+def _common_typecode(lists):
+    """Тип значень результату злиття ArrayLinkedList: "d", якщо є дійсні"""
+    typecodes = {linked_list.typecode for linked_list in lists}
+    return "d" if "d" in typecodes else lists[0].typecode
+
+
+def _clear(linked_list):
+    """Відв'язує всі вузли від списку без їх обходу"""
+    linked_list.head = None
+    linked_list.tail = None
+    linked_list.size = 0
+    linked_list.index = None
+
+
+def merge_k_sorted_linked_lists(lists, lazy=False):
+    """
+    Об'єднує k відсортованих однозв'язних списків в один відсортований.
+
+    Алгоритм (турнір на купі):
+    - У min-купі тримаємо поточні голови всіх непорожніх списків
+    - Щоразу забираємо найменшу голову та ставимо на її місце наступний
+      вузол того ж списку
+    - Складність: O(n log k) за часом, O(k) за пам'яттю, вузли не копіюються
+    - При рівних значеннях перевага надається списку з меншим номером,
+      тому злиття стабільне
+
+    Args:
+        lists: ітерований об'єкт з відсортованих LinkedList (якщо всі -
+               ArrayLinkedList, результат теж ArrayLinkedList з типом "d",
+               якщо хоч один вхідний список дійсний; у змішаному наборі
+               ArrayLinkedList перетворюються на LinkedList)
+        lazy: якщо True, повертає генератор значень без перезв'язування
+              вузлів (вхідні списки не змінюються, можна зупинитися раніше)
+
+    Returns:
+        LinkedList або генератор: об'єднаний відсортований список
+    """
+    lists = list(lists)
+
+    if lazy:
+        return heapq.merge(*lists)
+
+    if lists and all(isinstance(item, ArrayLinkedList) for item in lists):
+        merged_list = ArrayLinkedList.from_iterable(
+            heapq.merge(*lists), _common_typecode(lists)
+        )
+        for linked_list in lists:
+            linked_list.__init__(linked_list.typecode)
         return merged_list
 
-    # Використовуємо допоміжну функцію для злиття
-    merged_list.head = _merge_two_sorted_lists(list1.head, list2.head)
+    lists = [_as_node_list(linked_list) for linked_list in lists]
+    merged_list = LinkedList()
+    merged_list.size = sum(linked_list.size for linked_list in lists)
+
+    # Елемент купи: (значення, номер списку, вузол); пара (значення, номер)
+    # унікальна, тому вузли між собою ніколи не порівнюються
+    heap = [
+        (linked_list.head.data, order, linked_list.head)
+        for order, linked_list in enumerate(lists)
+        if linked_list.head is not None
+    ]
+    heapq.heapify(heap)
+
+    sentinel = Node()
+    tail = sentinel
+
+    while len(heap) > 1:
+        _, order, node = heap[0]
+        tail.next = node
+        tail = node
+        next_node = node.next
+        if next_node is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (next_node.data, order, next_node))
+
+    # Останній непорожній список приєднуємо цілком
+    if heap:
+        _, order, node = heap[0]
+        tail.next = node
+        tail = lists[order].tail
+
+    merged_list.head = sentinel.next
+    merged_list.tail = tail if merged_list.head is not None else None
+
+    if any(linked_list.index is not None for linked_list in lists):
+        SkipListIndex(merged_list)
+
+    for linked_list in lists:
+        _clear(linked_list)
 
     return merged_list
 
 
+def external_merge_sort(
+    iterable,
+    run_size=None,
+    memory_limit=64 * 2**20,
+    typecode="q",
+    fan_in=64,
+    tmp_dir=None,
+    as_linked_list=False,
+):
+    """
+    Зовнішнє (out-of-core) сортування злиттям числового потоку.
+
+    Алгоритм:
+    - Читаємо вхідний ітератор блоками по run_size елементів
+    - Кожен блок сортуємо як LinkedList через merge_sort_linked_list
+    - Відсортовані серії скидаємо у тимчасові файли як масиви typecode
+    - Якщо серій більше за fan_in, попередньо зливаємо їх групами
+    - Потоково зливаємо серії k-шляховим злиттям на купі
+    - У пам'яті одночасно перебуває не більше однієї серії (або буферів
+      читання під час злиття), тимчасові файли видаляються після обходу
+
+    Args:
+        iterable: ітерований об'єкт з числами (може бути нескінченно довгим
+                  відносно пам'яті, але скінченним)
+        run_size: кількість елементів в одній серії; якщо None, обчислюється
+                  з memory_limit
+        memory_limit: приблизна межа пам'яті в байтах для однієї серії
+        typecode: тип елементів у файлах ("q" - цілі, "d" - дійсні)
+        fan_in: максимальна кількість серій, що зливаються одночасно
+        tmp_dir: каталог для тимчасових файлів (None - системний)
+        as_linked_list: якщо True, повертає LinkedList замість ітератора
+
+    Returns:
+        Ітератор відсортованих значень або LinkedList
+    """
+    if run_size is None:
+        run_size = max(1, memory_limit // _node_memory_estimate())
+    if fan_in < 2:
+        raise ValueError("fan_in має бути не меншим за 2")
+
+    # Буфер читання однієї серії під час злиття
+    itemsize = array(typecode).itemsize
+    block_items = max(1024, memory_limit // (fan_in * itemsize))
+
+    result = _external_merge_iter(
+        iterable, run_size, typecode, fan_in, tmp_dir, block_items
+    )
+    if as_linked_list:
+        return LinkedList.from_iterable(result)
+    return result
+
+
+def _node_memory_estimate():
+    """Приблизний розмір одного вузла LinkedList з числовим значенням у байтах"""
+    node = Node(0)
+    return sys.getsizeof(node) + sys.getsizeof(node.__dict__) + sys.getsizeof(2**40)
+
+
+def _external_merge_iter(iterable, run_size, typecode, fan_in, tmp_dir, block_items):
+    """Генератор зовнішнього сортування: створення серій та їх злиття"""
+    with tempfile.TemporaryDirectory(prefix="llsort-", dir=tmp_dir) as directory:
+        iterator = iter(iterable)
+        run_paths = []
+
+        # 1. Розбиваємо потік на відсортовані серії
+        while True:
+            chunk = LinkedList.from_iterable(islice(iterator, run_size))
+            if chunk.head is None:
+                break
+            merge_sort_linked_list(chunk)
+            path = os.path.join(directory, f"run-{len(run_paths)}.bin")
+            _write_run(path, chunk, typecode, block_items)
+            run_paths.append(path)
+            del chunk
+
+        # 2. Попередні проходи злиття, якщо серій забагато
+        generation = 0
+        while len(run_paths) > fan_in:
+            generation += 1
+            merged_paths = []
+            for start in range(0, len(run_paths), fan_in):
+                group = run_paths[start : start + fan_in]
+                path = os.path.join(
+                    directory, f"merge-{generation}-{len(merged_paths)}.bin"
+                )
+                _write_run(
+                    path,
+                    heapq.merge(*(_read_run(p, typecode, block_items) for p in group)),
+                    typecode,
+                    block_items,
+                )
+                for old_path in group:
+                    os.remove(old_path)
+                merged_paths.append(path)
+            run_paths = merged_paths
+
+        # 3. Фінальне потокове злиття
+        yield from heapq.merge(
+            *(_read_run(path, typecode, block_items) for path in run_paths)
+        )
+
+
+def _write_run(path, values, typecode, block_items):
+    """Записує послідовність значень у файл блоками фіксованого розміру"""
+    with open(path, "wb") as file:
+        buffer = array(typecode)
+        for value in values:
+            buffer.append(value)
+            if len(buffer) >= block_items:
+                buffer.tofile(file)
+                buffer = array(typecode)
+        buffer.tofile(file)
+
+
+def _read_run(path, typecode, block_items):
+    """Генератор значень серії, що читає файл блоками"""
+    block_bytes = block_items * array(typecode).itemsize
+    with open(path, "rb") as file:
+        while True:
+            chunk = file.read(block_bytes)
+            if not chunk:
+                return
+            buffer = array(typecode)
+            buffer.frombytes(chunk)
+            yield from buffer
+
+
+def parallel_merge_sort_linked_list(
+    linked_list, workers=None, threshold=200_000, typecode="q"
+):
+    """
+    Паралельне сортування злиттям LinkedList з числовими значеннями.
+
+    Алгоритм:
+    - Ділимо список на workers сегментів приблизно однакової довжини
+    - Значення кожного сегмента пакуємо в array(typecode) і передаємо
+      робочому процесу як байти (а не як ланцюжок Node)
+    - Робочі процеси сортують сегменти через merge_sort_linked_list
+    - Відсортовані значення записуються назад у вузли своїх сегментів,
+      після чого сегменти зливаються через merge_k_sorted_linked_lists
+
+    Args:
+        linked_list: LinkedList об'єкт для сортування
+        workers: кількість процесів (None - кількість ядер процесора)
+        threshold: мінімальна довжина списку для паралельного режиму;
+                   коротші списки сортуються послідовно
+        typecode: тип значень для пакування ("q" - цілі, "d" - дійсні)
+
+    Returns:
+        LinkedList: відсортований список
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or linked_list.size < max(threshold, 2):
+        return merge_sort_linked_list(linked_list)
+
+    # Розрізаємо список на сегменти та пакуємо їх значення
+    segment_size = -(-linked_list.size // workers)
+    segments = []
+    packed = []
+    current = linked_list.head
+    while current is not None:
+        segment = LinkedList()
+        segment.head = current
+        values = array(typecode)
+        while current is not None and len(values) < segment_size:
+            values.append(current.data)
+            segment.tail = current
+            current = current.next
+        segment.tail.next = None
+        segment.size = len(values)
+        segments.append(segment)
+        packed.append((typecode, values.tobytes()))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        sorted_segments = pool.map(_sort_packed_segment, packed)
+
+        # Переписуємо відсортовані значення у вузли відповідних сегментів
+        for segment, payload in zip(segments, sorted_segments):
+            values = array(typecode)
+            values.frombytes(payload)
+            node = segment.head
+            for value in values:
+                node.data = value
+                node = node.next
+
+    merged_list = merge_k_sorted_linked_lists(segments)
+    linked_list.head = merged_list.head
+    linked_list.tail = merged_list.tail
+    linked_list.index = None
+    return linked_list
+
+
+def _sort_packed_segment(packed):
+    """Робочий процес: сортує упаковані значення сегмента"""
+    typecode, payload = packed
+    values = array(typecode)
+    values.frombytes(payload)
+    segment = ArrayLinkedList.from_iterable(values, typecode)
+    merge_sort_linked_list(segment)
+    return array(typecode, segment).tobytes()
+
+
+def _reverse_array_list(linked_list):
+    """Реверсування ArrayLinkedList: розвертаємо індексні посилання"""
+    links = linked_list.links
+    prev = NIL
+    current = linked_list.head
+    linked_list.tail = current
+
+    while current != NIL:
+        next_index = links[current]
+        links[current] = prev
+        prev = current
+        current = next_index
+
+    linked_list.head = prev
+    return linked_list
+
+
+def _merge_sort_array_list(linked_list, key=None, reverse=False):
+    """
+    Природне сортування злиттям ArrayLinkedList знизу вгору.
+    Той самий алгоритм, що й для Node, але над індексами в масивах.
+    Ключі (якщо задано key) обчислюються один раз у список за індексами комірок.
+    """
+    if linked_list.head == NIL:
+        return linked_list
+
+    values = linked_list.values
+    if key is not None:
+        # Лише для зв'язаних комірок: звільнені можуть містити застарілі значення
+        keys = [None] * len(values)
+        current = linked_list.head
+        while current != NIL:
+            keys[current] = key(values[current])
+            current = linked_list.links[current]
+        values = keys
+    if reverse:
+        _reverse_array_list(linked_list)
+    links = linked_list.links
+    head = linked_list.head
+
+    while True:
+        first = NIL  # Голова результату поточного проходу
+        tail = NIL
+        runs = 0
+        current = head
+
+        while current != NIL:
+            # Відрізаємо першу серію
+            left = current
+            left_tail = _cut_array_run(values, links, left)
+            right = links[left_tail]
+            links[left_tail] = NIL
+            runs += 1
+
+            if right == NIL:
+                merged_head, merged_tail = left, left_tail
+                current = NIL
+            else:
+                # Відрізаємо другу серію та зливаємо обидві
+                right_tail = _cut_array_run(values, links, right)
+                current = links[right_tail]
+                links[right_tail] = NIL
+                merged_head, merged_tail = _merge_array_runs(
+                    values, links, left, left_tail, right, right_tail
+                )
+
+            if tail == NIL:
+                first = merged_head
+            else:
+                links[tail] = merged_head
+            tail = merged_tail
+
+        head = first
+        if runs <= 1:
+            linked_list.head = head
+            linked_list.tail = tail
+            if reverse:
+                _reverse_array_list(linked_list)
+            return linked_list
+
+
+def _cut_array_run(values, links, head):
+    """Знаходить кінець неспадної серії в ArrayLinkedList"""
+    current = head
+    next_index = links[current]
+    while next_index != NIL and values[current] <= values[next_index]:
+        current = next_index
+        next_index = links[current]
+    return current
+
+
+def _merge_array_runs(values, links, left, left_tail, right, right_tail):
+    """Зливає дві серії ArrayLinkedList, повертає (голова, хвіст)"""
+    if values[left_tail] <= values[right]:
+        links[left_tail] = right
+        return left, right_tail
+
+    # Перший вузол результату
+    if values[left] <= values[right]:
+        head = left
+        left = links[left]
+    else:
+        head = right
+        right = links[right]
+    tail = head
+
+    while left != NIL and right != NIL:
+        if values[left] <= values[right]:
+            links[tail] = left
+            tail = left
+            left = links[left]
+        else:
+            links[tail] = right
+            tail = right
+            right = links[right]
+
+    if left != NIL:
+        links[tail] = left
+        return head, left_tail
+    links[tail] = right
+    return head, right_tail
+
+
+def _merge_two_sorted_array_lists(list1, list2):
+    """
+    Об'єднує два відсортовані ArrayLinkedList у новий суцільний список:
+    значення дописуються в масив у порядку злиття, тож фізичний порядок
+    комірок результату збігається з логічним.
+    """
+    merged_list = ArrayLinkedList(_common_typecode((list1, list2)))
+    merged_values = merged_list.values
+
+    values1, links1, current1 = list1.values, list1.links, list1.head
+    values2, links2, current2 = list2.values, list2.links, list2.head
+
+    while current1 != NIL and current2 != NIL:
+        if values1[current1] <= values2[current2]:
+            merged_values.append(values1[current1])
+            current1 = links1[current1]
+        else:
+            merged_values.append(values2[current2])
+            current2 = links2[current2]
+
+    while current1 != NIL:
+        merged_values.append(values1[current1])
+        current1 = links1[current1]
+    while current2 != NIL:
+        merged_values.append(values2[current2])
+        current2 = links2[current2]
+
+    size = len(merged_values)
+    if size:
+        merged_list.links.extend(range(1, size + 1))
+        merged_list.links[size - 1] = NIL
+        merged_list.head = 0
+        merged_list.tail = size - 1
+        merged_list.size = size
+
+    # Вхідні списки стають порожніми, як і для LinkedList
+    for linked_list in (list1, list2):
+        linked_list.__init__(linked_list.typecode)
+
+    return merged_list
+
+
+def benchmark_array_linked_list(n=1_000_000):
+    """
+    Порівняння пам'яті та швидкодії LinkedList і ArrayLinkedList.
+
+    Args:
+        n: кількість елементів у списках
+    """
+    data = [random.randrange(n) for _ in range(n)]
+
+    print(f"Порівняння LinkedList та ArrayLinkedList (n = {n:,})")
+    print("-" * 60)
+    print(
+        "{:<18}{:>12}{:>10}{:>10}{:>10}".format(
+            "Реалізація", "Пам'ять, МБ", "Побудова", "Реверс", "Сорт."
+        )
+    )
+
+    for cls in (LinkedList, ArrayLinkedList):
+        tracemalloc.start()
+        start = time.perf_counter()
+        linked_list = cls.from_iterable(data)
+        build_time = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0] / 2**20
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        reverse_linked_list(linked_list)
+        reverse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        merge_sort_linked_list(linked_list)
+        sort_time = time.perf_counter() - start
+
+        assert linked_list.to_list() == sorted(data)
+        print(
+            f"{cls.__name__:<18}{memory:>12.1f}"
+            f"{build_time:>9.2f}с{reverse_time:>9.2f}с{sort_time:>9.2f}с"
+        )
+
+
+def benchmark_parallel_merge_sort(n=2_000_000, max_workers=None):
+    """
+    Прискорення паралельного сортування залежно від кількості процесів.
+
+    Args:
+        n: кількість елементів у списку
+        max_workers: найбільша кількість процесів (None - кількість ядер)
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    data = [random.randrange(n) for _ in range(n)]
+
+    print(f"Паралельне сортування LinkedList (n = {n:,}, ядер: {os.cpu_count()})")
+    print("-" * 60)
+    print("{:<12}{:>12}{:>14}".format("Процесів", "Час, с", "Прискорення"))
+
+    serial_time = None
+    for workers in range(1, max_workers + 1):
+        linked_list = LinkedList.from_iterable(data)
+        start = time.perf_counter()
+        parallel_merge_sort_linked_list(linked_list, workers=workers, threshold=0)
+        elapsed = time.perf_counter() - start
+        if serial_time is None:
+            serial_time = elapsed
+
+        assert linked_list.to_list() == sorted(data)
+        print(f"{workers:<12}{elapsed:>12.2f}{serial_time / elapsed:>13.2f}x")
+
+
+def benchmark_key_sort(n=200_000):
+    """
+    Сортування записів з дорогим ключем: порівняння через обгортки з
+    __le__ (ключ розбирається при кожному порівнянні) проти key=
+    (ключ обчислюється один раз на вузол).
+
+    Args:
+        n: кількість записів
+    """
+    records = [
+        f"2024-{random.randint(1, 12):02d}-{random.randint(1, 28):02d},"
+        f"user{random.randrange(1000)},{random.randrange(10**6)}"
+        for _ in range(n)
+    ]
+
+    def parse_key(record):
+        date, user, amount = record.split(",")
+        return tuple(map(int, date.split("-"))), int(amount)
+
+    class ParsedRecord:
+        __slots__ = ("record",)
+
+        def __init__(self, record):
+            self.record = record
+
+        def __le__(self, other):
+            return parse_key(self.record) <= parse_key(other.record)
+
+    cases = [
+        (
+            "Обгортка з __le__",
+            lambda: LinkedList.from_iterable(map(ParsedRecord, records)),
+            {},
+        ),
+        (
+            "key=parse_key",
+            lambda: LinkedList.from_iterable(records),
+            {"key": parse_key},
+        ),
+        (
+            "key=str.lower",
+            lambda: LinkedList.from_iterable(records),
+            {"key": str.lower},
+        ),
+        (
+            "key + reverse",
+            lambda: LinkedList.from_iterable(records),
+            {"key": parse_key, "reverse": True},
+        ),
+    ]
+
+    print(f"Сортування записів з ключем (n = {n:,})")
+    print("-" * 60)
+    for title, build, options in cases:
+        linked_list = build()
+        start = time.perf_counter()
+        merge_sort_linked_list(linked_list, **options)
+        print(f"{title:<24}{time.perf_counter() - start:>10.2f}с")
+
+
+def benchmark_snapshot(n=1_000_000):
+    """
+    Час збереження та завантаження списку: текст проти бінарного знімка.
+
+    Args:
+        n: кількість елементів у списку
+    """
+    data = [random.randrange(2**40) for _ in range(n)]
+    linked_list = LinkedList.from_iterable(data)
+
+    print(f"Збереження та завантаження списку (n = {n:,})")
+    print("-" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "list.txt")
+        binary_path = os.path.join(directory, "list.bin")
+
+        start = time.perf_counter()
+        with open(text_path, "w") as file:
+            file.writelines(f"{value}\n" for value in linked_list)
+        text_save = time.perf_counter() - start
+        start = time.perf_counter()
+        linked_list.save(binary_path)
+        binary_save = time.perf_counter() - start
+        print(f"{'Збереження (текст)':<36}{text_save * 1000:>10.1f} мс")
+        print(f"{'Збереження (знімок)':<36}{binary_save * 1000:>10.1f} мс")
+
+        def load_text():
+            with open(text_path) as file:
+                return LinkedList.from_iterable(int(line) for line in file)
+
+        cases = [
+            ("LinkedList з тексту", load_text),
+            ("LinkedList.load", lambda: LinkedList.load(binary_path)),
+            ("ArrayLinkedList.load (mmap)", lambda: ArrayLinkedList.load(binary_path)),
+            (
+                "ArrayLinkedList.load (read)",
+                lambda: ArrayLinkedList.load(binary_path, mmap=False),
+            ),
+        ]
+        for title, load in cases:
+            start = time.perf_counter()
+            loaded = load()
+            elapsed = time.perf_counter() - start
+            assert len(loaded) == n
+            print(f"{title:<36}{elapsed * 1000:>10.1f} мс")
+
+
 # Демонстрація роботи функцій
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark_array_linked_list()
+        print()
+        benchmark_parallel_merge_sort()
+        print()
+        benchmark_key_sort()
+        print()
+        benchmark_snapshot()
+        sys.exit(0)
+
     print("=" * 60)
     print("Завдання 1: Робота з однозв'язним списком")
     print("=" * 60)
@@ -336,6 +1683,129 @@ if __name__ == "__main__":
     print("\nФінальний об'єднаний список:")
     final_merged.print_list()
 
+    # Тест 6: Список на типізованих масивах
+    print("\n\n6. Тест ArrayLinkedList (компактний список на масивах):")
+    print("-" * 60)
+
+    compact1 = ArrayLinkedList.from_iterable([42, 7, 19, 3, 25])
+    print("Несортований список:")
+    compact1.print_list()
+
+    merge_sort_linked_list(compact1)
+    print("\nВідсортований список:")
+    compact1.print_list()
+
+    reverse_linked_list(compact1)
+    print("\nРеверсований список:")
+    compact1.print_list()
+
+    compact1.remove(19)
+    compact1.insert_at_end(1)  # Використовує звільнену комірку
+    print("\nПісля видалення 19 та вставки 1:")
+    compact1.print_list()
+
+    merge_sort_linked_list(compact1)
+    compact2 = ArrayLinkedList.from_iterable([2, 4, 30])
+    compact_merged = merge_two_sorted_linked_lists(compact1, compact2)
+    print("\nОб'єднання з [2, 4, 30]:")
+    compact_merged.print_list()
+
+    # Тест 7: Злиття k відсортованих списків
+    print("\n\n7. Тест злиття k відсортованих списків:")
+    print("-" * 60)
+
+    shards = [
+        LinkedList.from_iterable([1, 4, 7, 10]),
+        LinkedList.from_iterable([2, 5, 8]),
+        LinkedList.from_iterable([0, 3, 6, 9, 12]),
+    ]
+    for number, shard in enumerate(shards, start=1):
+        print(f"Список {number}:")
+        shard.print_list()
+
+    first_values = []
+    for value in merge_k_sorted_linked_lists(shards, lazy=True):
+        if value > 4:
+            break
+        first_values.append(value)
+    print(f"\nЛіниве злиття, значення до 4: {first_values}")
+
+    merged_k = merge_k_sorted_linked_lists(shards)
+    print("\nОб'єднаний список:")
+    merged_k.print_list()
+
+    # Тест 8: Зовнішнє сортування
+    print("\n\n8. Тест зовнішнього сортування (серії по 4 елементи):")
+    print("-" * 60)
+
+    stream = [15, 3, 9, 27, 1, 18, 6, 12, 24, 0, 21]
+    print(f"Вхідний потік: {stream}")
+    external_sorted = external_merge_sort(stream, run_size=4, as_linked_list=True)
+    print("Відсортований список:")
+    external_sorted.print_list()
+
+    # Тест 9: Сортування записів за ключем
+    print("\n\n9. Тест сортування записів за ключем:")
+    print("-" * 60)
+
+    people = LinkedList.from_iterable(
+        ["Olena:31", "Ivan:25", "Maria:31", "Petro:19", "Anna:25"]
+    )
+    print("Записи:")
+    people.print_list()
+
+    merge_sort_linked_list(
+        people, key=lambda record: int(record.split(":")[1]), reverse=True
+    )
+    print("\nЗа віком (спадання, стабільно):")
+    people.print_list()
+
+    # Тест 10: Потоковий вивід довгого списку
+    print("\n\n10. Тест потокового виводу довгого списку:")
+    print("-" * 60)
+
+    long_list = LinkedList.from_iterable(range(1, 100_001))
+    print(f"Довжина: {len(long_list)}, сума: {sum(long_list)}")
+    print(f"Елементи 10..14: {list(long_list.islice(10, 15))}")
+    long_list.print_list(max_items=8)
+
+    # Тест 11: Індекс skip-list
+    print("\n\n11. Тест індексу skip-list над відсортованим списком:")
+    print("-" * 60)
+
+    indexed = merge_sort_linked_list(
+        LinkedList.from_iterable([40, 10, 70, 20, 60, 30, 50])
+    )
+    index = SkipListIndex(indexed, seed=42)
+    print("Відсортований список:")
+    indexed.print_list()
+
+    index.insert_sorted(35)
+    index.delete(60)
+    print("\nПісля вставки 35 та видалення 60:")
+    indexed.print_list()
+    print(f"35 у списку: {35 in index}, 60 у списку: {60 in index}")
+    print(f"Значення з проміжку [20, 50]: {list(index.iter_range(20, 50))}")
+
+    other = LinkedList.from_iterable([15, 45])
+    combined = merge_two_sorted_linked_lists(indexed, other)
+    print("\nПісля злиття з [15, 45] індекс перебудовано:")
+    combined.print_list()
+    print(f"45 у списку: {45 in combined.index}")
+
+    # Тест 12: Бінарний знімок списку
+    print("\n\n12. Тест збереження та завантаження бінарного знімка:")
+    print("-" * 60)
+
+    with tempfile.TemporaryDirectory() as snapshot_dir:
+        snapshot_path = os.path.join(snapshot_dir, "list.bin")
+        LinkedList.from_iterable([8, 6, 7, 5, 3, 0, 9]).save(snapshot_path)
+        print(f"Розмір знімка: {os.path.getsize(snapshot_path)} байт")
+        print("LinkedList.load:")
+        LinkedList.load(snapshot_path).print_list()
+        print("ArrayLinkedList.load:")
+        ArrayLinkedList.load(snapshot_path).print_list()
+
     print("\n" + "=" * 60)
     print("Всі тести завершено успішно!")
     print("=" * 60)
@@ -2,7 +2,26 @@
 # Необхідно написати програму на Python, яка використовує рекурсію для створення фрактала “дерево Піфагора”.
 # Програма має візуалізувати фрактал “дерево Піфагора”, і користувач повинен мати можливість вказати рівень рекурсії.
 
+import argparse
+import functools
+import math
+import os
+import struct
+import sys
+import tempfile
+import time
 import turtle
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # Інтерактивне малювання turtle працює і без numpy
+    np = None
+
+# Колір гілок (як "brown" у turtle) і фону для растрових зображень
+BRANCH_COLOR = (165, 42, 42)
+BACKGROUND_COLOR = (255, 255, 255)
 
 
 def draw_pythagoras_tree(t, branch_len, angle, level):
@@ -33,7 +52,929 @@ def draw_pythagoras_tree(t, branch_len, angle, level):
         t.backward(branch_len)
 
 
-def main():
+def draw_pythagoras_tree_fast(
+    t, branch_len, angle, level, length_factor=0.75, frame_segments=4096
+):
+    """
+    Швидке малювання дерева черепашкою з прогресивним виведенням.
+    Анімацію вимкнено (tracer), гілки кожного рівня малюються одним пакетом
+    за заздалегідь обчисленими координатами, а екран оновлюється після
+    кожного рівня (і не рідше ніж кожні frame_segments гілок, щоб час
+    одного кадру залишався обмеженим на глибоких рівнях).
+
+    t: об'єкт черепашки (дерево росте з її позиції в її напрямку)
+    Повертає список (рівень, кількість гілок, час малювання, час оновлення)
+    """
+    screen = t.getscreen()
+    previous_tracer = screen.tracer()
+    screen.tracer(0, 0)
+
+    start_position = t.position()
+    segments = pythagoras_tree_segments(
+        level, branch_len, angle, length_factor, start_position, t.heading()
+    )
+
+    timings = []
+    for depth in range(max(int(level), 0)):
+        level_segments = segments[2**depth - 1 : 2 ** (depth + 1) - 1].tolist()
+        draw_time = update_time = 0.0
+
+        for start in range(0, len(level_segments), frame_segments):
+            began = time.perf_counter()
+            for x0, y0, x1, y1 in level_segments[start : start + frame_segments]:
+                t.penup()
+                t.goto(x0, y0)
+                t.pendown()
+                t.goto(x1, y1)
+            updated = time.perf_counter()
+            screen.update()
+            draw_time += updated - began
+            update_time += time.perf_counter() - updated
+
+        timings.append((depth + 1, len(level_segments), draw_time, update_time))
+
+    # Повертаємо черепашку в початкову позицію, як і draw_pythagoras_tree
+    t.penup()
+    t.goto(start_position)
+    t.pendown()
+    screen.tracer(previous_tracer)
+    screen.update()
+    return timings
+
+
+def print_level_timings(timings):
+    """Виводить час малювання кожного рівня"""
+    print(f"{'Рівень':>6}{'Гілок':>10}{'Малювання, мс':>16}{'Оновлення, мс':>16}")
+    for depth, count, draw_time, update_time in timings:
+        print(
+            f"{depth:>6}{count:>10}{draw_time * 1000:>16.1f}{update_time * 1000:>16.1f}"
+        )
+    total = sum(draw + update for _, _, draw, update in timings)
+    print(f"Усього: {total:.2f} с")
+
+
+def _require_numpy():
+    """Обчислення гілок і рендеринг без GUI потребують numpy"""
+    if np is None:
+        raise ImportError(
+            "для цього режиму потрібен numpy: pip install numpy "
+            "(інтерактивне малювання працює і без нього)"
+        )
+
+
+def pythagoras_tree_segments(
+    level, branch_len=100, angle=45, length_factor=0.75, origin=(0, -200), heading=90
+):
+    """
+    Обчислює всі гілки дерева без turtle, рівень за рівнем у масивах NumPy.
+    Геометрія збігається з draw_pythagoras_tree: після гілки черепашка
+    повертає праворуч на angle, а потім ліворуч.
+
+    level: глибина рекурсії
+    branch_len: довжина стовбура
+    angle: кут повороту гілок у градусах
+    length_factor: у скільки разів наступна гілка коротша за попередню
+    origin: координати початку стовбура
+    heading: початковий напрямок у градусах (90 - вгору)
+
+    Повертає масив форми (2**level - 1, 4) з рядками (x0, y0, x1, y1);
+    гілки рівня d займають рядки [2**d - 1, 2**(d + 1) - 1).
+    """
+    _require_numpy()
+    level = max(int(level), 0)
+    segments = np.empty((2**level - 1, 4), dtype=np.float64)
+
+    x = np.array([float(origin[0])])
+    y = np.array([float(origin[1])])
+    headings = np.array([math.radians(heading)])
+    delta = math.radians(angle)
+    length = float(branch_len)
+
+    for depth in range(level):
+        x_end = x + length * np.cos(headings)
+        y_end = y + length * np.sin(headings)
+
+        block = segments[2**depth - 1 : 2 ** (depth + 1) - 1]
+        block[:, 0] = x
+        block[:, 1] = y
+        block[:, 2] = x_end
+        block[:, 3] = y_end
+
+        if depth + 1 < level:
+            # Кожна гілка дає дві: спочатку праву, потім ліву
+            x = np.repeat(x_end, 2)
+            y = np.repeat(y_end, 2)
+            headings = np.column_stack((headings - delta, headings + delta)).ravel()
+            length *= length_factor
+
+    return segments
+
+
+def iter_tree_segments(
+    level,
+    branch_len=100,
+    angle=45,
+    length_factor=0.75,
+    origin=(0, -200),
+    heading=90,
+    batch_size=1 << 16,
+    viewport=None,
+    min_extent=0.0,
+):
+    """
+    Генератор гілок дерева пакетами фіксованого розміру.
+
+    Замість рекурсії використовується явний стек фрагментів рівня: фрагмент
+    містить до batch_size вершин (початок, напрямок) однієї глибини. Після
+    обробки фрагмента його нащадки кладуться на стек, а надто великі фрагменти
+    діляться навпіл. Тому стек має O(level) фрагментів, і пікова пам'ять
+    обмежена O(level * batch_size) незалежно від 2**level.
+
+    Відсікання піддерев (level of detail): кожне піддерево з коренем у точці
+    (x, y) вміщується в коло радіуса _subtree_reach. Піддерева, чиє коло не
+    перетинає viewport, не генеруються зовсім, а для піддерев, менших за
+    min_extent, малюється лише їхня перша гілка.
+
+    viewport: видима область (xmin, ymin, xmax, ymax) або None
+    min_extent: мінімальний розмір піддерева у світових одиницях
+    Інші параметри ті самі, що й у pythagoras_tree_segments.
+    Повертає масиви форми (batch_size, 4) з рядками (x0, y0, x1, y1),
+    останній пакет може бути меншим.
+    """
+    _require_numpy()
+    level = max(int(level), 0)
+    if level == 0:
+        return
+
+    delta = math.radians(angle)
+    # Фрагмент стеку: (x, y, напрямки, довжина гілки, залишок рівнів)
+    stack = [
+        (
+            np.array([float(origin[0])]),
+            np.array([float(origin[1])]),
+            np.array([math.radians(heading)]),
+            float(branch_len),
+            level,
+        )
+    ]
+    pending = []
+    pending_count = 0
+
+    while stack:
+        x, y, headings, length, remaining = stack.pop()
+        reach = _subtree_reach(length, length_factor, remaining)
+
+        if viewport is not None:
+            # Відстань від кореня піддерева до прямокутника видимої області
+            dx = np.maximum(np.maximum(viewport[0] - x, x - viewport[2]), 0)
+            dy = np.maximum(np.maximum(viewport[1] - y, y - viewport[3]), 0)
+            visible = dx * dx + dy * dy <= reach * reach
+            if not visible.all():
+                x, y, headings = x[visible], y[visible], headings[visible]
+                if len(x) == 0:
+                    continue
+
+        x_end = x + length * np.cos(headings)
+        y_end = y + length * np.sin(headings)
+        pending.append(np.column_stack((x, y, x_end, y_end)))
+        pending_count += len(x)
+
+        # Віддаємо повні пакети, залишок чекає наступних фрагментів
+        if pending_count >= batch_size:
+            merged = np.concatenate(pending)
+            full = len(merged) - len(merged) % batch_size
+            for start in range(0, full, batch_size):
+                yield merged[start : start + batch_size]
+            pending = [merged[full:]] if full < len(merged) else []
+            pending_count = len(merged) - full
+
+        if remaining > 1 and reach >= min_extent:
+            child_x = np.repeat(x_end, 2)
+            child_y = np.repeat(y_end, 2)
+            child_headings = np.column_stack(
+                (headings - delta, headings + delta)
+            ).ravel()
+            child_length = length * length_factor
+            # Ділимо фрагмент, щоб він не перевищував batch_size;
+            # другу половину кладемо першою, щоб перша оброблялась раніше
+            parts = max(1, -(-len(child_x) // batch_size))
+            for part in reversed(range(parts)):
+                piece = slice(part * batch_size, (part + 1) * batch_size)
+                stack.append(
+                    (
+                        child_x[piece],
+                        child_y[piece],
+                        child_headings[piece],
+                        child_length,
+                        remaining - 1,
+                    )
+                )
+
+    if pending_count:
+        yield np.concatenate(pending)
+
+
+def _subtree_reach(length, length_factor, levels):
+    """
+    Радіус кола навколо кореня, що містить піддерево з levels рівнями:
+    сума довжин гілок вздовж найдовшого шляху.
+    """
+    if length_factor == 1:
+        return length * levels
+    return length * (1 - length_factor**levels) / (1 - length_factor)
+
+
+def tree_bounds(
+    level,
+    branch_len=100,
+    angle=45,
+    length_factor=0.75,
+    origin=(0, -200),
+    heading=90,
+    probe_level=12,
+):
+    """
+    Межі дерева без генерації всіх гілок: будуємо перші probe_level рівнів
+    і розширюємо їх межі на радіус піддерев, що залишились.
+    """
+    probe_level = min(level, probe_level)
+    probe = pythagoras_tree_segments(
+        probe_level, branch_len, angle, length_factor, origin, heading
+    )
+    xmin, ymin, xmax, ymax = segments_bounds(probe, margin=0.0)
+    pad = _subtree_reach(
+        branch_len * length_factor**probe_level, length_factor, level - probe_level
+    )
+    return (xmin - pad, ymin - pad, xmax + pad, ymax + pad)
+
+
+def _tree_frames(depth, branch_len, angle, length_factor, origin, heading):
+    """
+    Вершини дерева на глибині depth: координати початку гілок, їхні напрямки
+    (у радіанах) і спільна довжина гілки на цій глибині.
+    """
+    x = np.array([float(origin[0])])
+    y = np.array([float(origin[1])])
+    headings = np.array([math.radians(heading)])
+    delta = math.radians(angle)
+    length = float(branch_len)
+
+    for _ in range(depth):
+        x_end = np.repeat(x + length * np.cos(headings), 2)
+        y = np.repeat(y + length * np.sin(headings), 2)
+        x = x_end
+        headings = np.column_stack((headings - delta, headings + delta)).ravel()
+        length *= length_factor
+
+    return x, y, headings, length
+
+
+@functools.lru_cache(maxsize=64)
+def _unit_subtree(depth, angle, length_factor):
+    """
+    Кешований блок - піддерево глибини depth у локальній системі координат:
+    корінь у (0, 0), напрямок 0, довжина стовбура 1. Масив лише для читання.
+    """
+    block = pythagoras_tree_segments(depth, 1.0, angle, length_factor, (0, 0), 0)
+    block.setflags(write=False)
+    return block
+
+
+def instanced_tree_segments(
+    level,
+    branch_len=100,
+    angle=45,
+    length_factor=0.75,
+    origin=(0, -200),
+    heading=90,
+    block_depth=10,
+    batch_size=1 << 16,
+):
+    """
+    Генератор гілок дерева через інстансинг самоподібного піддерева.
+
+    Кожне піддерево дерева Піфагора - це масштабована та повернута копія
+    блоку глибини block_depth. Блок обчислюється один раз (і кешується
+    для тих самих angle та length_factor), а всі глибші рівні отримуються
+    пакетними афінними перетвореннями блоку: поворот на напрямок вершини,
+    масштаб на довжину гілки та зсув у її початок. Верхні
+    level - block_depth рівнів будуються напряму.
+
+    Параметри ті самі, що й у iter_tree_segments.
+    Повертає масиви форми (N, 4) з рядками (x0, y0, x1, y1).
+    """
+    _require_numpy()
+    level = max(int(level), 0)
+    if level == 0:
+        return
+    block_depth = max(1, min(int(block_depth), level))
+    top_depth = level - block_depth
+
+    # Верхня частина дерева, над коренями блоків
+    if top_depth:
+        top = pythagoras_tree_segments(
+            top_depth, branch_len, angle, length_factor, origin, heading
+        )
+        yield from iter_batches(top, batch_size)
+
+    block = _unit_subtree(block_depth, angle, length_factor)
+    frame_x, frame_y, frame_headings, length = _tree_frames(
+        top_depth, branch_len, angle, length_factor, origin, heading
+    )
+
+    # Блок повертається як (x * cos - y * sin, x * sin + y * cos)
+    bx0, by0, bx1, by1 = block.T
+    frames_per_batch = max(1, batch_size // len(block))
+
+    for start in range(0, len(frame_x), frames_per_batch):
+        piece = slice(start, start + frames_per_batch)
+        cos = (length * np.cos(frame_headings[piece]))[:, None]
+        sin = (length * np.sin(frame_headings[piece]))[:, None]
+        fx = frame_x[piece, None]
+        fy = frame_y[piece, None]
+
+        batch = np.empty((len(cos), len(block), 4))
+        batch[:, :, 0] = fx + cos * bx0 - sin * by0
+        batch[:, :, 1] = fy + sin * bx0 + cos * by0
+        batch[:, :, 2] = fx + cos * bx1 - sin * by1
+        batch[:, :, 3] = fy + sin * bx1 + cos * by1
+        yield batch.reshape(-1, 4)
+
+
+def sweep_pythagoras_trees(level, angles, length_factors, block_depth=10, **kwargs):
+    """
+    Перебір параметрів дерева: для кожної пари (angle, length_factor)
+    повертає (angle, length_factor, генератор пакетів гілок).
+    Блоки піддерев кешуються за (block_depth, angle, length_factor), тому
+    повторні проходи та різні рівні, довжини чи положення дерева з тими
+    самими кутом і коефіцієнтом не обчислюють блок заново.
+    """
+    for angle in angles:
+        for length_factor in length_factors:
+            yield angle, length_factor, instanced_tree_segments(
+                level,
+                angle=angle,
+                length_factor=length_factor,
+                block_depth=block_depth,
+                **kwargs,
+            )
+
+
+def iter_batches(segments, batch_size=1 << 16):
+    """
+    Приводить відрізки до ітератора пакетів: масив (N, 4) ділиться на
+    частини, а ітератор пакетів (наприклад, iter_tree_segments) віддається
+    як є.
+    """
+    if isinstance(segments, np.ndarray):
+        for start in range(0, len(segments), batch_size):
+            yield segments[start : start + batch_size]
+    else:
+        yield from segments
+
+
+def segments_bounds(segments, margin=0.02):
+    """
+    Прямокутник (xmin, ymin, xmax, ymax), що містить усі гілки,
+    з відносним відступом margin з кожного боку.
+    segments: масив (N, 4) або ітератор пакетів
+    """
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
+    for batch in iter_batches(segments):
+        if len(batch) == 0:
+            continue
+        xs = batch[:, [0, 2]]
+        ys = batch[:, [1, 3]]
+        xmin, xmax = min(xmin, float(xs.min())), max(xmax, float(xs.max()))
+        ymin, ymax = min(ymin, float(ys.min())), max(ymax, float(ys.max()))
+
+    if xmin > xmax:
+        return (-1.0, -1.0, 1.0, 1.0)
+    pad = max(xmax - xmin, ymax - ymin, 1e-9) * margin
+    return (xmin - pad, ymin - pad, xmax + pad, ymax + pad)
+
+
+def _fit_bounds(bounds, width, height):
+    """Розширює прямокутник так, щоб його пропорції збігалися з полотном"""
+    xmin, ymin, xmax, ymax = bounds
+    scale = max((xmax - xmin) / width, (ymax - ymin) / height)
+    cx, cy = (xmin + xmax) / 2, (ymin + ymax) / 2
+    half_w, half_h = scale * width / 2, scale * height / 2
+    return (cx - half_w, cy - half_h, cx + half_w, cy + half_h)
+
+
+def _pixel_size(bounds, width, height):
+    """
+    Відстань між центрами сусідніх пікселів у світових одиницях (x, y),
+    як у rasterize_segments: центри крайніх пікселів лежать на межах bounds.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    return (xmax - xmin) / max(width - 1, 1), (ymax - ymin) / max(height - 1, 1)
+
+
+def _window_viewport(bounds, width, height, rows, cols):
+    """
+    Світова область вікна пікселів (рядки rows, стовпці cols у вигляді
+    [start, stop)) разом із краями пікселів і запасом ще в один піксель.
+    Одна формула для цілого кадру і для плиток, щоб відсікання збігалося.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    step_x, step_y = _pixel_size(bounds, width, height)
+    return (
+        xmin + (cols[0] - 1.5) * step_x,
+        ymax - (rows[1] + 0.5) * step_y,
+        xmin + (cols[1] + 0.5) * step_x,
+        ymax - (rows[0] - 1.5) * step_y,
+    )
+
+
+def rasterize_segments(
+    image,
+    segments,
+    bounds,
+    color=BRANCH_COLOR,
+    batch_size=1 << 16,
+    canvas_shape=None,
+    offset=(0, 0),
+):
+    """
+    Малює відрізки на RGB-полотні (масив height x width x 3) без GUI.
+    Кожен відрізок дискретизується з кроком не більше одного пікселя;
+    відрізки обробляються пакетами по batch_size, щоб обмежити пам'ять.
+
+    image: масив uint8 форми (height, width, 3), змінюється на місці
+    segments: масив (N, 4) з рядками (x0, y0, x1, y1) у світових координатах
+              або ітератор таких пакетів
+    bounds: світові координати полотна (xmin, ymin, xmax, ymax)
+    canvas_shape: (height, width) усього полотна, якщо image - лише його
+                  частина (плитка); None - image і є полотном
+    offset: (рядок, стовпець) лівого верхнього пікселя image на полотні
+
+    Повертає кількість оброблених відрізків.
+    """
+    _require_numpy()
+    tile_height, tile_width = image.shape[:2]
+    height, width = (
+        canvas_shape if canvas_shape is not None else (tile_height, tile_width)
+    )
+    row0, col0 = offset
+    xmin, ymin, xmax, ymax = bounds
+    scale_x = (width - 1) / (xmax - xmin)
+    scale_y = (height - 1) / (ymax - ymin)
+    window = (col0, row0, col0 + tile_width, row0 + tile_height)
+    color = np.asarray(color, dtype=np.uint8)
+    count = 0
+
+    for batch in iter_batches(segments, batch_size):
+        count += len(batch)
+        # Переводимо в піксельні координати (вісь y полотна напрямлена вниз)
+        px0 = (batch[:, 0] - xmin) * scale_x
+        py0 = (ymax - batch[:, 1]) * scale_y
+        px1 = (batch[:, 2] - xmin) * scale_x
+        py1 = (ymax - batch[:, 3]) * scale_y
+
+        # Точки беремо з кроком не більше пікселя вздовж усього відрізка, але
+        # генеруємо лише ті, що потрапляють у відсічену частину. Координати
+        # та положення точок рахуються на всьому полотні, а зсув плитки
+        # віднімається вже від цілих номерів пікселів, тому плитки
+        # збігаються з цілим кадром піксель у піксель.
+        visible, t0, t1 = _clip_to_canvas(px0, py0, px1, py1, window)
+        px0, py0, px1, py1 = px0[visible], py0[visible], px1[visible], py1[visible]
+        intervals = np.ceil(np.maximum(np.abs(px1 - px0), np.abs(py1 - py0)))
+        first_step = np.maximum(np.floor(t0[visible] * intervals), 0)
+        last_step = np.minimum(np.ceil(t1[visible] * intervals), intervals)
+        steps = (last_step - first_step).astype(np.int64) + 1
+
+        owner = np.repeat(np.arange(len(px0)), steps)
+        first = np.cumsum(steps) - steps
+        t = (np.arange(owner.size) - first[owner] + first_step[owner]) / np.maximum(
+            intervals, 1
+        )[owner]
+
+        cols = np.rint(px0[owner] + t * (px1 - px0)[owner]).astype(np.int64) - col0
+        rows = np.rint(py0[owner] + t * (py1 - py0)[owner]).astype(np.int64) - row0
+        inside = (cols >= 0) & (cols < tile_width) & (rows >= 0) & (rows < tile_height)
+        image[rows[inside], cols[inside]] = color
+
+    return count
+
+
+def _clip_to_canvas(px0, py0, px1, py1, window):
+    """
+    Відсікає відрізки вікном пікселів полотна (алгоритм Ліанга - Барскі).
+    window: (col0, row0, col1, row1) - стовпці [col0, col1) і рядки [row0, row1)
+    Кількість точок дискретизації рахується лише для відсіченої частини,
+    тому гілка в багато разів довша за полотно не стає пунктирною.
+
+    Повертає маску відрізків, що перетинають полотно, та межі параметра
+    t0 <= t <= t1 їхньої видимої частини.
+    """
+    dx, dy = px1 - px0, py1 - py0
+    t0 = np.zeros_like(px0)
+    t1 = np.ones_like(px0)
+    visible = np.ones(px0.shape, dtype=bool)
+    col0, row0, col1, row1 = window
+    # Межі пікселів: центр пікселя 0 має координату 0
+    for p, q in (
+        (-dx, px0 - (col0 - 0.5)),
+        (dx, col1 - 0.5 - px0),
+        (-dy, py0 - (row0 - 0.5)),
+        (dy, row1 - 0.5 - py0),
+    ):
+        parallel = p == 0
+        visible &= ~(parallel & (q < 0))
+        ratio = np.divide(q, p, out=np.zeros_like(q), where=~parallel)
+        t0 = np.where(p < 0, np.maximum(t0, ratio), t0)
+        t1 = np.where(p > 0, np.minimum(t1, ratio), t1)
+    visible &= t0 <= t1
+    return visible, t0, t1
+
+
+def write_png(path, image, rows_per_chunk=256):
+    """
+    Записує RGB-масив (height x width x 3, uint8) у файл PNG.
+    Рядки стискаються блоками, тому зображення може бути np.memmap.
+    """
+    height, width = image.shape[:2]
+
+    def chunk(tag, data):
+        return (
+            struct.pack(">I", len(data))
+            + tag
+            + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    compressor = zlib.compressobj(6)
+    with open(path, "wb") as file:
+        file.write(b"\x89PNG\r\n\x1a\n")
+        file.write(
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        )
+        for start in range(0, height, rows_per_chunk):
+            rows = np.asarray(image[start : start + rows_per_chunk]).reshape(
+                -1, width * 3
+            )
+            # Кожен рядок PNG починається з байта типу фільтра (0 - без фільтра)
+            raw = np.hstack((np.zeros((len(rows), 1), dtype=np.uint8), rows))
+            data = compressor.compress(raw.tobytes())
+            if data:
+                file.write(chunk(b"IDAT", data))
+        file.write(chunk(b"IDAT", compressor.flush()))
+        file.write(chunk(b"IEND", b""))
+
+
+def write_svg(
+    path, segments, bounds, width, height, color=BRANCH_COLOR, stroke_width=1
+):
+    """
+    Записує відрізки у векторний SVG одним елементом path.
+    Вісь y інвертується, щоб дерево росло вгору, як у turtle.
+    segments: масив (N, 4) або ітератор пакетів; повертає кількість відрізків.
+    """
+    xmin, ymin, xmax, ymax = bounds
+    stroke = "#{:02x}{:02x}{:02x}".format(*color)
+    # Товщина лінії задається в пікселях полотна
+    line_width = stroke_width * (xmax - xmin) / width
+    view_box = f"{xmin:.3f} {-ymax:.3f} {xmax - xmin:.3f} {ymax - ymin:.3f}"
+
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{width}" height="{height}" viewBox="{view_box}">\n'
+            f'<path fill="none" stroke="{stroke}" '
+            f'stroke-width="{line_width:.4f}" d="'
+        )
+        count = 0
+        for batch in iter_batches(segments, 1 << 14):
+            count += len(batch)
+            file.write(
+                "".join(
+                    f"M{x0:.2f} {-y0:.2f}L{x1:.2f} {-y1:.2f}"
+                    for x0, y0, x1, y1 in batch.tolist()
+                )
+            )
+        file.write('"/>\n</svg>\n')
+    return count
+
+
+def write_csv(path, segments):
+    """
+    Записує відрізки у CSV з колонками x0,y0,x1,y1.
+    segments: масив (N, 4) або ітератор пакетів; повертає кількість відрізків.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("x0,y0,x1,y1\n")
+        for batch in iter_batches(segments):
+            np.savetxt(file, batch, fmt="%.4f", delimiter=",")
+            count += len(batch)
+    return count
+
+
+def write_binary(path, segments, dtype="<f4"):
+    """
+    Записує відрізки як суцільний масив чисел dtype (4 числа на відрізок),
+    який читається назад через np.fromfile(path, dtype).reshape(-1, 4).
+    segments: масив (N, 4) або ітератор пакетів; повертає кількість відрізків.
+    """
+    count = 0
+    with open(path, "wb") as file:
+        for batch in iter_batches(segments):
+            batch.astype(dtype).tofile(file)
+            count += len(batch)
+    return count
+
+
+def render_pythagoras_tree(
+    path,
+    level,
+    width=1024,
+    height=1024,
+    branch_len=100,
+    angle=45,
+    length_factor=0.75,
+    stream=False,
+    batch_size=1 << 16,
+    viewport=None,
+    pixel_threshold=None,
+    instanced=False,
+):
+    """
+    Рендерить дерево у файл без GUI. Формат визначається розширенням:
+    .png - растр, .svg - вектор, .csv - таблиця відрізків,
+    інше - двійковий масив float32.
+
+    stream: генерувати гілки пакетами через iter_tree_segments, щоб пам'ять
+            не залежала від рівня (для .png/.svg межі дерева обчислюються
+            окремим проходом генератора)
+    viewport: видима область (xmin, ymin, xmax, ymax) для наближення;
+              гілки поза нею не генеруються
+    pixel_threshold: розмір піддерева в пікселях полотна, нижче якого
+                     його гілки не деталізуються (level of detail)
+    instanced: генерувати гілки через instanced_tree_segments
+
+    Повертає кількість намальованих гілок.
+    """
+    _require_numpy()
+    if viewport is not None or pixel_threshold is not None:
+        return _render_culled(
+            path,
+            level,
+            width,
+            height,
+            branch_len,
+            angle,
+            length_factor,
+            batch_size,
+            viewport,
+            pixel_threshold or 0.0,
+        )
+
+    if instanced:
+
+        def segments():
+            return instanced_tree_segments(
+                level, branch_len, angle, length_factor, batch_size=batch_size
+            )
+
+    elif stream:
+
+        def segments():
+            return iter_tree_segments(
+                level, branch_len, angle, length_factor, batch_size=batch_size
+            )
+
+    else:
+        all_segments = pythagoras_tree_segments(level, branch_len, angle, length_factor)
+
+        def segments():
+            return all_segments
+
+    suffix = str(path).lower().rsplit(".", 1)[-1]
+    if suffix == "csv":
+        return write_csv(path, segments())
+    if suffix not in ("png", "svg"):
+        return write_binary(path, segments())
+
+    bounds = _fit_bounds(segments_bounds(segments()), width, height)
+    if suffix == "svg":
+        return write_svg(path, segments(), bounds, width, height)
+
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = BACKGROUND_COLOR
+    count = rasterize_segments(image, segments(), bounds)
+    write_png(path, image)
+    return count
+
+
+def _render_culled(
+    path,
+    level,
+    width,
+    height,
+    branch_len,
+    angle,
+    length_factor,
+    batch_size,
+    viewport,
+    pixel_threshold,
+):
+    """
+    Рендеринг з відсіканням: межі полотна відомі заздалегідь, тому гілки
+    генеруються лише один раз і лише для видимої деталізації.
+    """
+    if viewport is None:
+        viewport = tree_bounds(level, branch_len, angle, length_factor)
+    bounds = _fit_bounds(viewport, width, height)
+    # Розмір одного пікселя у світових одиницях
+    pixel = _pixel_size(bounds, width, height)[0]
+
+    segments = iter_tree_segments(
+        level,
+        branch_len,
+        angle,
+        length_factor,
+        batch_size=batch_size,
+        viewport=_window_viewport(bounds, width, height, (0, height), (0, width)),
+        min_extent=pixel_threshold * pixel,
+    )
+
+    suffix = str(path).lower().rsplit(".", 1)[-1]
+    if suffix == "svg":
+        return write_svg(path, segments, bounds, width, height)
+    if suffix == "csv":
+        return write_csv(path, segments)
+    if suffix != "png":
+        return write_binary(path, segments)
+
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = BACKGROUND_COLOR
+    count = rasterize_segments(image, segments, bounds)
+    write_png(path, image)
+    return count
+
+
+def render_tiled_png(
+    path,
+    level,
+    width=16384,
+    height=16384,
+    branch_len=100,
+    angle=45,
+    length_factor=0.75,
+    tile_size=2048,
+    workers=None,
+    pixel_threshold=1.0,
+    tmp_dir=None,
+):
+    """
+    Рендерить дерево у великий PNG паралельно по плитках.
+
+    Полотно ділиться на плитки tile_size x tile_size, кожна плитка
+    рендериться окремим процесом пулу. Процес генерує лише гілки, чиї
+    піддерева (за їхніми обмежувальними колами) перетинають плитку, і
+    записує плитку у спільний буфер зображення np.memmap у тимчасовому
+    файлі. Потім буфер потоково стискається у PNG.
+
+    workers: кількість процесів (None - кількість ядер процесора)
+    pixel_threshold: поріг деталізації в пікселях, як у render_pythagoras_tree
+
+    Повертає кількість згенерованих гілок (гілки на межах плиток
+    враховуються в кожній плитці, яку вони перетинають).
+    """
+    _require_numpy()
+    bounds = _fit_bounds(
+        tree_bounds(level, branch_len, angle, length_factor), width, height
+    )
+    shape = (height, width, 3)
+
+    with tempfile.TemporaryDirectory(prefix="pythagoras-", dir=tmp_dir) as directory:
+        buffer_path = os.path.join(directory, "canvas.rgb")
+        # Файл буфера створюється порожнім, фон заповнюють самі процеси
+        np.memmap(buffer_path, dtype=np.uint8, mode="w+", shape=shape).flush()
+
+        tasks = [
+            (
+                buffer_path,
+                shape,
+                rows,
+                cols,
+                bounds,
+                (level, branch_len, angle, length_factor),
+                pixel_threshold,
+            )
+            for rows in _tile_ranges(height, tile_size)
+            for cols in _tile_ranges(width, tile_size)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            count = sum(pool.map(_render_tile, tasks))
+
+        image = np.memmap(buffer_path, dtype=np.uint8, mode="r", shape=shape)
+        write_png(path, image)
+        del image
+
+    return count
+
+
+def _tile_ranges(size, tile_size):
+    """Межі плиток [start, stop) уздовж однієї осі"""
+    return [
+        (start, min(start + tile_size, size)) for start in range(0, size, tile_size)
+    ]
+
+
+def _render_tile(task):
+    """Робочий процес: рендерить одну плитку та записує її у спільний буфер"""
+    buffer_path, shape, rows, cols, bounds, tree, pixel_threshold = task
+    level, branch_len, angle, length_factor = tree
+    height, width = shape[:2]
+
+    tile = np.empty((rows[1] - rows[0], cols[1] - cols[0], 3), dtype=np.uint8)
+    tile[:] = BACKGROUND_COLOR
+    segments = iter_tree_segments(
+        level,
+        branch_len,
+        angle,
+        length_factor,
+        viewport=_window_viewport(bounds, width, height, rows, cols),
+        min_extent=pixel_threshold * _pixel_size(bounds, width, height)[0],
+    )
+    # Проєкція на все полотно, плитка - лише вікно в ньому
+    count = rasterize_segments(
+        tile, segments, bounds, canvas_shape=(height, width), offset=(rows[0], cols[0])
+    )
+
+    image = np.memmap(buffer_path, dtype=np.uint8, mode="r+", shape=shape)
+    image[rows[0] : rows[1], cols[0] : cols[1]] = tile
+    image.flush()
+    del image
+    return count
+
+
+def benchmark_tiled(level=20, size=4096, tile_size=1024, max_workers=None):
+    """Масштабування плиткового рендерингу залежно від кількості процесів"""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    print(
+        f"Плитковий рендеринг {size}x{size}, рівень {level} "
+        f"(ядер: {os.cpu_count()})"
+    )
+    print("-" * 60)
+    print("{:<12}{:>12}{:>14}".format("Процесів", "Час, с", "Прискорення"))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "tree.png")
+        # Еталон: однопрохідний рендеринг з тим самим порогом деталізації
+        reference_path = os.path.join(directory, "reference.png")
+        render_pythagoras_tree(reference_path, level, size, size, pixel_threshold=1.0)
+        with open(reference_path, "rb") as file:
+            reference = file.read()
+
+        serial_time = None
+        for workers in range(1, max_workers + 1):
+            start = time.perf_counter()
+            render_tiled_png(
+                path, level, size, size, tile_size=tile_size, workers=workers
+            )
+            elapsed = time.perf_counter() - start
+            with open(path, "rb") as file:
+                assert file.read() == reference, "плитки не збігаються з цілим кадром"
+            if serial_time is None:
+                serial_time = elapsed
+            print(f"{workers:<12}{elapsed:>12.2f}{serial_time / elapsed:>13.2f}x")
+
+
+def benchmark_generators(level=20):
+    """Порівняння часу генерації всіх гілок різними способами"""
+    cases = [
+        ("pythagoras_tree_segments", lambda: [pythagoras_tree_segments(level)]),
+        ("iter_tree_segments", lambda: iter_tree_segments(level)),
+        ("instanced_tree_segments", lambda: instanced_tree_segments(level)),
+    ]
+    print(f"Генерація гілок дерева (рівень {level}, {2**level - 1:,} гілок)")
+    print("-" * 60)
+    for title, generate in cases:
+        start = time.perf_counter()
+        count = sum(len(batch) for batch in generate())
+        elapsed = time.perf_counter() - start
+        print(f"{title:<34}{elapsed:>8.2f} с{count / elapsed / 1e6:>10.1f} млн/с")
+
+    angles = [30, 40, 45, 50]
+    factors = [0.6, 0.7, 0.75]
+    for attempt in ("перший", "повторний"):
+        start = time.perf_counter()
+        for _, _, batches in sweep_pythagoras_trees(level - 4, angles, factors):
+            for _ in batches:
+                pass
+        elapsed = time.perf_counter() - start
+        title = f"Перебір {len(angles) * len(factors)} параметрів ({attempt})"
+        print(f"{title:<34}{elapsed:>8.2f} с")
+
+
+def main(fast=False):
     # Налаштування екрана
     screen = turtle.Screen()
     screen.title("Фрактал: Дерево Піфагора")
@@ -54,7 +995,11 @@ def main():
         )  # Для того щоб фрактал був як на картинці рівень рекурсії
         # має бути 8
         # Виклик функції: довжина гілки 100, кут 45 градусів
-        draw_pythagoras_tree(t, 100, 45, level)
+        if fast:
+            # Швидкий режим: по рівнях, з вимірюванням часу кожного рівня
+            print_level_timings(draw_pythagoras_tree_fast(t, 100, 45, level))
+        else:
+            draw_pythagoras_tree(t, 100, 45, level)
 
         print("Готово!")
     except ValueError:
@@ -64,5 +1009,105 @@ def main():
     screen.mainloop()
 
 
+def parse_args(argv=None):
+    """Аргументи командного рядка для рендерингу без GUI"""
+    parser = argparse.ArgumentParser(description="Фрактал: Дерево Піфагора")
+    parser.add_argument("--level", type=int, help="рівень рекурсії")
+    parser.add_argument("--output", help="файл .png, .svg, .csv або .bin (без GUI)")
+    parser.add_argument("--size", type=int, default=1024, help="розмір полотна")
+    parser.add_argument("--angle", type=float, default=45, help="кут гілок")
+    parser.add_argument(
+        "--factor", type=float, default=0.75, help="коефіцієнт довжини гілок"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="генерувати гілки пакетами з обмеженою пам'яттю",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=1 << 16, help="розмір пакета гілок"
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="швидке малювання turtle по рівнях з вимірюванням часу",
+    )
+    parser.add_argument(
+        "--instanced",
+        action="store_true",
+        help="генерувати гілки через інстансинг піддерева",
+    )
+    parser.add_argument(
+        "--bench", action="store_true", help="порівняти способи генерації гілок"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="плитковий рендеринг PNG на вказаній кількості процесів",
+    )
+    parser.add_argument(
+        "--tile-size", type=int, default=2048, help="розмір плитки в пікселях"
+    )
+    parser.add_argument(
+        "--lod",
+        type=float,
+        metavar="PIXELS",
+        help="не деталізувати піддерева, менші за PIXELS пікселів",
+    )
+    parser.add_argument(
+        "--viewport",
+        type=float,
+        nargs=4,
+        metavar=("XMIN", "YMIN", "XMAX", "YMAX"),
+        help="видима область у координатах дерева (для наближення)",
+    )
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.bench:
+        benchmark_generators(args.level or 20)
+        print()
+        benchmark_tiled(args.level or 20, max_workers=args.workers)
+        sys.exit(0)
+
+    if args.output and args.workers:
+        # Плитковий режим: python task2.py --level 22 --size 16384 --workers 8 ...
+        start = time.perf_counter()
+        count = render_tiled_png(
+            args.output,
+            args.level if args.level is not None else 10,
+            width=args.size,
+            height=args.size,
+            angle=args.angle,
+            length_factor=args.factor,
+            tile_size=args.tile_size,
+            workers=args.workers,
+            pixel_threshold=args.lod if args.lod is not None else 1.0,
+        )
+        elapsed = time.perf_counter() - start
+        print(f"Збережено {args.output}: {count} гілок за {elapsed:.2f} с")
+        sys.exit(0)
+
+    if args.output:
+        # Безголовий режим: python task2.py --level 18 --output tree.png
+        start = time.perf_counter()
+        count = render_pythagoras_tree(
+            args.output,
+            args.level if args.level is not None else 10,
+            width=args.size,
+            height=args.size,
+            angle=args.angle,
+            length_factor=args.factor,
+            stream=args.stream,
+            batch_size=args.batch_size,
+            viewport=args.viewport,
+            pixel_threshold=args.lod,
+            instanced=args.instanced,
+        )
+        elapsed = time.perf_counter() - start
+        print(f"Збережено {args.output}: {count} гілок за {elapsed:.2f} с")
+        sys.exit(0)
+
+    main(fast=args.fast)
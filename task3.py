@@ -3,22 +3,113 @@
 
 Реалізація алгоритму Дейкстри для знаходження найкоротших шляхів
 уcі з використанням бінарної купи (heap) для оптимізації.
+
+Додатково: компактне незмінне представлення графа у форматі CSR
+(FrozenGraph) з цілими ідентифікаторами вершин, запити найкоротшого шляху
+між двома вершинами з раннім завершенням та двонаправленим пошуком,
+A* з орієнтирами (ALT) та ієрархії стягувань (contraction hierarchies)
+для повторних запитів на незмінному графі; підключувані черги з пріоритетом
+(бінарна купа, черга Діала, radix-купа, індексована d-арна купа);
+паралельне обчислення матриці відстаней від багатьох джерел;
+кеш дерев найкоротших шляхів з LRU-витісненням та інвалідацією при змінах;
+динамічне оновлення дерева найкоротших шляхів при зміні ребер;
+потокове завантаження великих графів з файлів списку ребер та DIMACS.
 """
 
 import heapq
+import math
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
+import weakref
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Optional
 
 
 class WeightedGraph:
     """Зважений граф представлений списком суміжності"""
 
-    def __init__(self):
+    def __init__(self, directed: bool = False):
         self.graph: Dict[str, List[Tuple[str, int]]] = {}
+        self.directed = directed
+        # Вхідні ребра потрібні зворотному пошуку в орієнтованому графі
+        self.incoming: Optional[Dict[str, List[Tuple[str, int]]]] = (
+            {} if directed else None
+        )
+        self.max_weight = 0  # Верхня межа ваг ребер (не зменшується)
+        self.integer_weights = True  # Чи всі ваги цілі
+        self.version = 0  # Збільшується при кожній зміні графа
+        self._observers: Optional[weakref.WeakSet] = None  # До першої підписки
+
+    def __getstate__(self):
+        """Спостерігачі (слабкі посилання) не серіалізуються разом з графом"""
+        state = self.__dict__.copy()
+        state["_observers"] = None
+        return state
+
+    def add_observer(self, observer):
+        """
+        Підписує об'єкт на зміни графа (слабке посилання).
+
+        Після кожної зміни спостерігач отримує один з викликів:
+        vertex_added(vertex), edge_added(from_vertex, to_vertex, weight),
+        edge_removed(from_vertex, to_vertex, weight) або
+        edge_weight_changed(from_vertex, to_vertex, old_weight, new_weight).
+        """
+        if self._observers is None:
+            self._observers = weakref.WeakSet()
+        self._observers.add(observer)
+
+    def _notify(self, event: str, *args):
+        """Збільшує версію графа та сповіщає спостерігачів"""
+        self.version += 1
+        for observer in list(self._observers or ()):
+            getattr(observer, event)(*args)
+
+    @classmethod
+    def from_edges(
+        cls,
+        names: List[str],
+        sources: array,
+        targets: array,
+        weights: array,
+        directed: bool = False,
+    ) -> "WeightedGraph":
+        """
+        Будує граф за один прохід з масивів ребер з цілими ідентифікаторами
+        (без add_edge для кожного ребра). Ребро i: names[sources[i]] ->
+        names[targets[i]] з вагою weights[i].
+        """
+        graph = cls(directed)
+        adjacency: List[List[Tuple[str, int]]] = [[] for _ in names]
+        incoming = [[] for _ in names] if directed else adjacency
+        for source, target, weight in zip(sources, targets, weights):
+            adjacency[source].append((names[target], weight))
+            incoming[target].append((names[source], weight))
+        graph.graph = dict(zip(names, adjacency))
+        if directed:
+            graph.incoming = dict(zip(names, incoming))
+        graph.max_weight = max(weights, default=0)
+        graph.integer_weights = weights.typecode == "q"
+        return graph
 
     def add_vertex(self, vertex: str):
         """Додає вершину до графа"""
         if vertex not in self.graph:
             self.graph[vertex] = []
+            if self.directed:
+                self.incoming[vertex] = []
+            # Без підписників (звичайна побудова графа) лише змінюємо версію
+            if self._observers is not None:
+                self._notify("vertex_added", vertex)
+            else:
+                self.version += 1
 
     def add_edge(self, from_vertex: str, to_vertex: str, weight: int):
         """Додає зважене ребро до графа"""
@@ -28,7 +119,63 @@ class WeightedGraph:
 
         # Додаємо ребро (для неорієнтованого графа додаємо в обидві сторони)
         self.graph[from_vertex].append((to_vertex, weight))
-        self.graph[to_vertex].append((from_vertex, weight))
+        reverse = self.incoming if self.directed else self.graph
+        reverse[to_vertex].append((from_vertex, weight))
+
+        # Гарячий шлях побудови графа: без зайвих викликів методів
+        if weight > self.max_weight:
+            self.max_weight = weight
+        if not isinstance(weight, int):
+            self.integer_weights = False
+        if self._observers is not None:
+            self._notify("edge_added", from_vertex, to_vertex, weight)
+        else:
+            self.version += 1
+
+    def remove_edge(self, from_vertex: str, to_vertex: str):
+        """
+        Видаляє ребро між двома вершинами (одне з паралельних ребер).
+
+        Raises:
+            ValueError: якщо ребра немає
+        """
+        weight = self._edge_weight(from_vertex, to_vertex)
+        self.graph[from_vertex].remove((to_vertex, weight))
+        self._reverse_edges(to_vertex).remove((from_vertex, weight))
+        self._notify("edge_removed", from_vertex, to_vertex, weight)
+
+    def set_edge_weight(self, from_vertex: str, to_vertex: str, weight: int):
+        """
+        Змінює вагу ребра між двома вершинами.
+
+        Raises:
+            ValueError: якщо ребра немає
+        """
+        old_weight = self._edge_weight(from_vertex, to_vertex)
+        for neighbors, neighbor in (
+            (self.graph[from_vertex], to_vertex),
+            (self._reverse_edges(to_vertex), from_vertex),
+        ):
+            neighbors[neighbors.index((neighbor, old_weight))] = (neighbor, weight)
+        self._track_weight(weight)
+        self._notify("edge_weight_changed", from_vertex, to_vertex, old_weight, weight)
+
+    def _reverse_edges(self, vertex: str) -> List[Tuple[str, int]]:
+        """Список, куди записується зворотний бік ребра, що входить у vertex"""
+        return self.incoming[vertex] if self.directed else self.graph[vertex]
+
+    def _edge_weight(self, from_vertex: str, to_vertex: str) -> int:
+        """Вага першого ребра між двома вершинами"""
+        for neighbor, weight in self.graph.get(from_vertex, []):
+            if neighbor == to_vertex:
+                return weight
+        raise ValueError(f"Ребра {from_vertex} - {to_vertex} немає в графі")
+
+    def _track_weight(self, weight: int):
+        """Діапазон ваг потрібен для автоматичного вибору черги з пріоритетом"""
+        self.max_weight = max(self.max_weight, weight)
+        if not isinstance(weight, int):
+            self.integer_weights = False
 
     def get_vertices(self) -> List[str]:
         """Повертає список всіх вершин"""
@@ -38,6 +185,33 @@ class WeightedGraph:
         """Повертає список сусідів вершини з вагами ребер"""
         return self.graph.get(vertex, [])
 
+    def get_incoming(self, vertex: str) -> List[Tuple[str, int]]:
+        """Повертає вершини, з яких ведуть ребра у vertex, з вагами ребер"""
+        if self.directed:
+            return self.incoming.get(vertex, [])
+        return self.get_neighbors(vertex)
+
+    def freeze(self) -> "FrozenGraph":
+        """
+        Створює незмінну компактну копію графа у форматі CSR.
+        Імена вершин замінюються цілими ідентифікаторами (0..n-1).
+        """
+        names = list(self.graph.keys())
+        ids = {name: index for index, name in enumerate(names)}
+
+        # Цілі ваги зберігаємо як int64, інакше - як double
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("q" if self.integer_weights else "d")
+
+        for name in names:
+            for neighbor, weight in self.graph[name]:
+                targets.append(ids[neighbor])
+                weights.append(weight)
+            offsets.append(len(targets))
+
+        return FrozenGraph(names, offsets, targets, weights, self.directed)
+
     def __str__(self):
         """Строкове представлення графа"""
         result = "Граф:\n"
@@ -47,15 +221,339 @@ class WeightedGraph:
         return result
 
 
+class FrozenGraph:
+    """
+    Незмінний зважений граф у форматі CSR (compressed sparse row).
+
+    Вершина з ідентифікатором i має вихідні ребра з індексами
+    offsets[i]..offsets[i + 1] - 1 у масивах targets (сусіди) та weights (ваги).
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        offsets: array,
+        targets: array,
+        weights: array,
+        directed: bool = False,
+    ):
+        self.names = names  # Ідентифікатор -> ім'я вершини
+        self.ids = {name: index for index, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+        self.max_weight = max(weights, default=0)
+        self.integer_weights = weights.typecode == "q"
+        self._reverse: Optional["FrozenGraph"] = None  # Граф з оберненими ребрами
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        """Кількість записів суміжності (неорієнтоване ребро дає два)"""
+        return len(self.targets)
+
+    def get_vertices(self) -> List[str]:
+        """Повертає список всіх вершин"""
+        return list(self.names)
+
+    def get_neighbors(self, vertex: str) -> List[Tuple[str, int]]:
+        """Повертає список сусідів вершини з вагами ребер (за іменами)"""
+        index = self.ids.get(vertex)
+        if index is None:
+            return []
+        start, end = self.offsets[index], self.offsets[index + 1]
+        names = self.names
+        return [
+            (names[target], weight)
+            for target, weight in zip(self.targets[start:end], self.weights[start:end])
+        ]
+
+    def get_incoming(self, vertex: str) -> List[Tuple[str, int]]:
+        """
+        Повертає вершини, з яких ведуть ребра у vertex, з вагами ребер.
+        Для орієнтованого графа обернений CSR будується при першому виклику.
+        """
+        if not self.directed:
+            return self.get_neighbors(vertex)
+        if self._reverse is None:
+            sources = array("q")
+            for vertex_id in range(self.num_vertices):
+                sources.extend(
+                    [vertex_id]
+                    * (self.offsets[vertex_id + 1] - self.offsets[vertex_id])
+                )
+            self._reverse = _csr_from_edges(
+                self.names, self.targets, sources, self.weights, directed=True
+            )
+        return self._reverse.get_neighbors(vertex)
+
+    def memory_usage(self) -> int:
+        """Приблизний обсяг пам'яті масивів CSR у байтах"""
+        return sum(
+            part.itemsize * len(part)
+            for part in (self.offsets, self.targets, self.weights)
+        )
+
+
+def _csr_from_edges(
+    names: List[str],
+    sources: array,
+    targets: array,
+    weights: array,
+    directed: bool = False,
+) -> FrozenGraph:
+    """
+    Будує FrozenGraph з масивів ребер: ребра впорядковуються за початковою
+    вершиною стабільним сортуванням numpy, offsets - кумулятивні степені.
+    Для неорієнтованого графа кожне ребро додається в обидва боки.
+    """
+    import numpy as np  # Лише для CSR-побудови: WeightedGraph і dijkstra без numpy
+
+    typecode = weights.typecode
+    sources = np.frombuffer(sources, dtype=np.int64)
+    targets = np.frombuffer(targets, dtype=np.int64)
+    weights = np.frombuffer(weights, dtype=np.int64 if typecode == "q" else np.float64)
+    if not directed:
+        # Зворотне ребро одразу після прямого - той самий порядок, що й add_edge
+        sources, targets = (
+            np.column_stack((sources, targets)).ravel(),
+            np.column_stack((targets, sources)).ravel(),
+        )
+        weights = np.repeat(weights, 2)
+
+    order = np.argsort(sources, kind="stable")
+    degrees = np.bincount(sources, minlength=len(names))
+    offsets = np.zeros(len(names) + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+
+    def to_array(code: str, values: "np.ndarray") -> array:
+        result = array(code)
+        result.frombytes(values.tobytes())
+        return result
+
+    return FrozenGraph(
+        names,
+        to_array("q", offsets),
+        to_array("q", targets[order]),
+        to_array(typecode, weights[order]),
+        directed,
+    )
+
+
+class HeapQueue:
+    """
+    Бінарна купа heapq. Зменшення ключа - повторне додавання;
+    застарілі записи відкидає сам алгоритм Дейкстри.
+    """
+
+    def __init__(self):
+        self.heap: List[Tuple[float, str]] = []
+
+    def push(self, priority: float, item):
+        heapq.heappush(self.heap, (priority, item))
+
+    def pop(self) -> Tuple[float, object]:
+        return heapq.heappop(self.heap)
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class DialQueue:
+    """
+    Черга Діала: циклічний масив з max_weight + 1 кошиків.
+
+    Для монотонної черги (як у Дейкстрі) усі ключі лежать у проміжку
+    [поточний мінімум, поточний мінімум + max_weight], тому кошик
+    priority % (max_weight + 1) містить лише записи з однаковим ключем.
+    Працює лише з цілими невід'ємними вагами.
+    """
+
+    def __init__(self, max_weight: int):
+        self.buckets: List[list] = [[] for _ in range(max_weight + 1)]
+        self.cursor = 0  # Поточний мінімальний ключ
+        self.size = 0
+
+    def push(self, priority: int, item):
+        self.buckets[priority % len(self.buckets)].append(item)
+        self.size += 1
+
+    def pop(self) -> Tuple[int, object]:
+        buckets, count = self.buckets, len(self.buckets)
+        cursor = self.cursor
+        while not buckets[cursor % count]:
+            cursor += 1
+        self.cursor = cursor
+        self.size -= 1
+        return cursor, buckets[cursor % count].pop()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class RadixHeap:
+    """
+    Radix-купа для монотонної черги з цілими ключами.
+
+    Запис з ключем k лежить у кошику номер (k ^ last).bit_length(), де last -
+    останній вилучений ключ. Коли кошик 0 порожній, найменший непорожній
+    кошик розподіляється заново відносно свого мінімуму; кожен запис
+    переміщується щонайбільше O(log C) разів.
+    """
+
+    def __init__(self):
+        self.buckets: List[List[Tuple[int, object]]] = [[]]
+        self.last = 0
+        self.size = 0
+
+    def push(self, priority: int, item):
+        index = (priority ^ self.last).bit_length()
+        buckets = self.buckets
+        while len(buckets) <= index:
+            buckets.append([])
+        buckets[index].append((priority, item))
+        self.size += 1
+
+    def pop(self) -> Tuple[int, object]:
+        buckets = self.buckets
+        if not buckets[0]:
+            index = 1
+            while not buckets[index]:
+                index += 1
+            entries = buckets[index]
+            buckets[index] = []
+            last = self.last = min(entries)[0]
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self.size -= 1
+        return buckets[0].pop()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class IndexedDaryHeap:
+    """
+    Індексована d-арна купа зі справжнім зменшенням ключа.
+
+    Позиція кожного елемента зберігається у словнику, тому push для вже
+    наявного елемента зменшує його ключ на місці, і застарілих записів
+    у купі немає.
+    """
+
+    def __init__(self, arity: int = 4):
+        self.arity = arity
+        self.keys: List[float] = []
+        self.items: list = []
+        self.position: Dict[object, int] = {}
+
+    def push(self, priority: float, item):
+        index = self.position.get(item)
+        if index is None:
+            index = len(self.items)
+            self.keys.append(priority)
+            self.items.append(item)
+        elif priority < self.keys[index]:
+            self.keys[index] = priority
+        else:
+            return
+        self._sift_up(index)
+
+    def pop(self) -> Tuple[float, object]:
+        keys, items, position = self.keys, self.items, self.position
+        priority, item = keys[0], items[0]
+        del position[item]
+        last_key, last_item = keys.pop(), items.pop()
+        if items:
+            keys[0], items[0] = last_key, last_item
+            self._sift_down(0)
+        return priority, item
+
+    def _sift_up(self, index: int):
+        keys, items, position = self.keys, self.items, self.position
+        key, item = keys[index], items[index]
+        while index:
+            parent = (index - 1) // self.arity
+            if keys[parent] <= key:
+                break
+            keys[index], items[index] = keys[parent], items[parent]
+            position[items[index]] = index
+            index = parent
+        keys[index], items[index] = key, item
+        position[item] = index
+
+    def _sift_down(self, index: int):
+        keys, items, position = self.keys, self.items, self.position
+        key, item = keys[index], items[index]
+        size, arity = len(keys), self.arity
+        while True:
+            first = index * arity + 1
+            if first >= size:
+                break
+            child = min(range(first, min(first + arity, size)), key=keys.__getitem__)
+            if keys[child] >= key:
+                break
+            keys[index], items[index] = keys[child], items[child]
+            position[items[index]] = index
+            index = child
+        keys[index], items[index] = key, item
+        position[item] = index
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+# Найбільша вага ребра, за якої обирається черга Діала
+DIAL_MAX_WEIGHT = 1000
+
+
+def make_priority_queue(queue: str, graph: WeightedGraph):
+    """
+    Створює чергу з пріоритетом для алгоритму Дейкстри.
+
+    Args:
+        queue: "heap", "dial", "radix", "dary" або "auto" - вибір за
+            діапазоном ваг: цілі ваги до DIAL_MAX_WEIGHT - черга Діала,
+            інакше - бінарна купа (heapq написаний на C і за великих ваг
+            швидший за radix-купу на Python, див. benchmark_priority_queues)
+        graph: Граф (WeightedGraph або FrozenGraph)
+
+    Raises:
+        ValueError: невідома черга або dial/radix для дробових ваг
+    """
+    if queue == "auto":
+        if graph.integer_weights and graph.max_weight <= DIAL_MAX_WEIGHT:
+            queue = "dial"
+        else:
+            queue = "heap"
+
+    if queue in ("dial", "radix") and not graph.integer_weights:
+        raise ValueError(f"Черга '{queue}' потребує цілих ваг ребер")
+    if queue == "heap":
+        return HeapQueue()
+    if queue == "dial":
+        return DialQueue(graph.max_weight)
+    if queue == "radix":
+        return RadixHeap()
+    if queue == "dary":
+        return IndexedDaryHeap()
+    raise ValueError(f"Невідома черга з пріоритетом: {queue}")
+
+
 def dijkstra(
-    graph: WeightedGraph, start_vertex: str
+    graph: WeightedGraph, start_vertex: str, queue: str = "auto"
 ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
     """
-    Алгоритм Дейкстри з використанням бінарної купи.
+    Алгоритм Дейкстри з використанням черги з пріоритетом.
 
     Args:
         graph: Зважений граф
         start_vertex: Початкова вершина
+        queue: Черга з пріоритетом (див. make_priority_queue)
 
     Returns:
         Tuple з двох словників:
@@ -70,16 +568,16 @@ def dijkstra(
     # Словник для відстеження попередніх вершин (для відновлення шляху)
     previous = {vertex: None for vertex in graph.get_vertices()}
 
-    # Бінарна купа (min-heap) для ефективного вибору вершини з мінімальною відстанню
-    # Формат: (відстань, вершина)
-    priority_queue = [(0, start_vertex)]
+    # Черга з пріоритетом для ефективного вибору вершини з мінімальною відстанню
+    priority_queue = make_priority_queue(queue, graph)
+    priority_queue.push(0, start_vertex)
 
     # Множина відвіданих вершин
     visited = set()
 
     while priority_queue:
         # Витягуємо вершину з найменшою відстанню
-        current_distance, current_vertex = heapq.heappop(priority_queue)
+        current_distance, current_vertex = priority_queue.pop()
 
         # Якщо вершина вже відвідана, пропускаємо
         if current_vertex in visited:
@@ -102,12 +600,850 @@ def dijkstra(
             if distance < distances[neighbor]:
                 distances[neighbor] = distance
                 previous[neighbor] = current_vertex
-                # Додаємо в купу з новою відстанню
+                # Додаємо в чергу з новою відстанню (або зменшуємо ключ)
+                priority_queue.push(distance, neighbor)
+
+    return distances, previous
+
+
+def dijkstra_frozen(graph: FrozenGraph, start_vertex: str) -> Tuple[List[float], array]:
+    """
+    Алгоритм Дейкстри над FrozenGraph з цілими ідентифікаторами вершин.
+
+    Замість словників і множини відвіданих вершин використовується список
+    відстаней та масив попередників, індексовані ідентифікатором вершини.
+
+    Args:
+        graph: Граф у форматі CSR
+        start_vertex: Початкова вершина (ім'я)
+
+    Returns:
+        Tuple з двох масивів, індексованих ідентифікатором вершини:
+        - distances: відстані від початкової вершини (infinity - недосяжна)
+        - previous: ідентифікатор попередньої вершини (-1 - немає)
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    infinity = float("infinity")
+    distances = [infinity] * graph.num_vertices
+    previous = array("q", [-1]) * graph.num_vertices
+
+    start = graph.ids[start_vertex]
+    distances[start] = 0
+    priority_queue = [(0, start)]
+
+    while priority_queue:
+        current_distance, current = heapq.heappop(priority_queue)
+
+        # Застарілий запис у купі: вершину вже оброблено з меншою відстанню
+        if current_distance > distances[current]:
+            continue
+
+        for index in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[index]
+            distance = current_distance + weights[index]
+            if distance < distances[neighbor]:
+                distances[neighbor] = distance
+                previous[neighbor] = current
                 heapq.heappush(priority_queue, (distance, neighbor))
 
     return distances, previous
 
 
+def reconstruct_path_frozen(
+    graph: FrozenGraph, previous: array, start_vertex: str, end_vertex: str
+) -> List[str]:
+    """
+    Відновлює найкоротший шлях за масивом попередників з dijkstra_frozen.
+
+    Returns:
+        Список імен вершин у найкоротшому шляху (порожній, якщо шляху немає)
+    """
+    start = graph.ids[start_vertex]
+    current = graph.ids[end_vertex]
+    if previous[current] == -1 and current != start:
+        return []
+
+    path = []
+    while current != -1:
+        path.append(graph.names[current])
+        current = previous[current]
+    path.reverse()
+    return path
+
+
+def dijkstra_many(
+    graph: WeightedGraph, sources: List[str], workers=None, output: str = None
+) -> "np.ndarray":
+    """
+    Відстані від багатьох джерел, обчислені паралельно на пулі процесів.
+
+    Граф заморожується у FrozenGraph і передається кожному процесу один раз
+    через ініціалізатор пулу; далі процесам надсилаються лише імена джерел.
+
+    Args:
+        graph: WeightedGraph або FrozenGraph
+        sources: Початкові вершини (рядки матриці)
+        workers: Кількість процесів (None - кількість ядер процесора)
+        output: Шлях до файлу .npy; якщо задано, процеси записують рядки
+            прямо у файл (np.memmap), і матриця може не поміщатися в пам'ять
+
+    Returns:
+        Матриця float64 розміром len(sources) x num_vertices; стовпці
+        відповідають ідентифікаторам вершин FrozenGraph (infinity -
+        недосяжна вершина). У потоковому режимі - np.memmap на output.
+    """
+    import numpy as np
+
+    frozen = graph if isinstance(graph, FrozenGraph) else graph.freeze()
+    shape = (len(sources), frozen.num_vertices)
+    if output is None:
+        matrix = np.empty(shape, dtype=np.float64)
+    else:
+        matrix = np.lib.format.open_memmap(
+            output, mode="w+", dtype=np.float64, shape=shape
+        )
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(sources) < 2:
+        for row, source in enumerate(sources):
+            matrix[row] = dijkstra_frozen(frozen, source)[0]
+    else:
+        if output is not None:
+            matrix.flush()
+        chunksize = max(1, len(sources) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_dijkstra_worker,
+            initargs=(frozen, output),
+        ) as pool:
+            for row, distances in pool.map(
+                _dijkstra_row, enumerate(sources), chunksize=chunksize
+            ):
+                if distances is not None:
+                    matrix[row] = distances
+
+    if output is not None:
+        matrix.flush()
+    return matrix
+
+
+# Стан процесу пулу dijkstra_many (задається ініціалізатором)
+_worker_graph: Optional[FrozenGraph] = None
+_worker_output: Optional["np.ndarray"] = None
+
+
+def _init_dijkstra_worker(graph: FrozenGraph, output: Optional[str]):
+    """Ініціалізатор процесу: зберігає граф і відкриває файл результату"""
+    import numpy as np
+
+    global _worker_graph, _worker_output
+    _worker_graph = graph
+    _worker_output = None if output is None else np.load(output, mmap_mode="r+")
+
+
+def _dijkstra_row(task):
+    """Робочий процес: один рядок матриці; у потоковому режимі - прямо у файл"""
+    import numpy as np
+
+    row, source = task
+    distances = np.array(dijkstra_frozen(_worker_graph, source)[0], dtype=np.float64)
+    if _worker_output is None:
+        return row, distances
+    _worker_output[row] = distances
+    _worker_output.flush()
+    return row, None
+
+
+class ShortestPathCache:
+    """
+    Кеш результатів dijkstra для "гарячих" джерел з LRU-витісненням.
+
+    Кеш підписується на зміни графа. Нова вершина додається в усі дерева як
+    недосяжна; нове ребро (u, v, w) видаляє лише ті записи, для яких
+    d(s, u) + w < d(s, v) або d(s, v) + w < d(s, u), - інші дерева
+    залишаються точними.
+
+    Повернуті словники належать кешу, змінювати їх не можна.
+    """
+
+    def __init__(self, graph: WeightedGraph, max_size: int = 128):
+        self.graph = graph
+        self.max_size = max_size
+        self.entries: OrderedDict = OrderedDict()  # джерело -> (distances, previous)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        graph.add_observer(self)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, source: str) -> bool:
+        return source in self.entries
+
+    def get(self, source: str) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        """Дерево найкоротших шляхів від source (з кешу або обчислене)"""
+        entry = self.entries.get(source)
+        if entry is not None:
+            self.entries.move_to_end(source)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        distances, previous = dijkstra(self.graph, source)
+        self.put(source, distances, previous)
+        return distances, previous
+
+    def path(self, source: str, target: str) -> Tuple[float, List[str]]:
+        """Відстань та найкоротший шлях source -> target"""
+        distances, previous = self.get(source)
+        if distances[target] == float("infinity"):
+            return distances[target], []
+        return distances[target], reconstruct_path(previous, source, target)
+
+    def put(
+        self,
+        source: str,
+        distances: Dict[str, float],
+        previous: Dict[str, Optional[str]],
+        version: Optional[int] = None,
+    ) -> bool:
+        """
+        Додає дерево, обчислене деінде (наприклад, в іншому процесі).
+
+        Args:
+            version: Версія графа, для якої обчислено дерево; якщо граф
+                відтоді змінився, дерево не приймається
+
+        Returns:
+            True, якщо дерево збережено
+        """
+        if version is not None and version != self.graph.version:
+            return False
+        self.entries[source] = (distances, previous)
+        self.entries.move_to_end(source)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        return True
+
+    def clear(self):
+        """Видаляє всі записи (лічильники зберігаються)"""
+        self.entries.clear()
+
+    def vertex_added(self, vertex: str):
+        """Нова вершина ще не має ребер - у всіх деревах вона недосяжна"""
+        for distances, previous in self.entries.values():
+            distances[vertex] = float("infinity")
+            previous[vertex] = None
+
+    def edge_added(self, from_vertex: str, to_vertex: str, weight: int):
+        """Видаляє лише дерева, які нове ребро може покращити"""
+        infinity = float("infinity")
+        directions = _edge_directions(self.graph, from_vertex, to_vertex)
+        self._invalidate(
+            source
+            for source, (distances, _) in self.entries.items()
+            if any(
+                distances.get(parent, infinity) + weight
+                < distances.get(child, infinity)
+                for parent, child in directions
+            )
+        )
+
+    def edge_removed(self, from_vertex: str, to_vertex: str, weight: int):
+        """Видаляє дерева, в яких ребро лежить на найкоротшому шляху"""
+        self._invalidate(
+            source
+            for source, entry in self.entries.items()
+            if _tree_edge_child(self.graph, *entry, from_vertex, to_vertex, weight)
+            is not None
+        )
+
+    def edge_weight_changed(
+        self, from_vertex: str, to_vertex: str, old_weight: int, new_weight: int
+    ):
+        """Зменшення ваги - як нове ребро, збільшення - як видалення"""
+        if new_weight < old_weight:
+            self.edge_added(from_vertex, to_vertex, new_weight)
+        elif new_weight > old_weight:
+            self.edge_removed(from_vertex, to_vertex, old_weight)
+
+    def _invalidate(self, sources):
+        stale = list(sources)
+        for source in stale:
+            del self.entries[source]
+        self.invalidations += len(stale)
+
+
+def _edge_directions(
+    graph: WeightedGraph, from_vertex: str, to_vertex: str
+) -> Tuple[Tuple[str, str], ...]:
+    """Напрямки, у яких ребро можна пройти: (початок, кінець)"""
+    if graph.directed:
+        return ((from_vertex, to_vertex),)
+    return (from_vertex, to_vertex), (to_vertex, from_vertex)
+
+
+def _tree_edge_child(
+    graph: WeightedGraph,
+    distances: Dict[str, float],
+    previous: Dict[str, Optional[str]],
+    from_vertex: str,
+    to_vertex: str,
+    weight: int,
+) -> Optional[str]:
+    """Нижній кінець ребра, якщо ребро з такою вагою лежить на дереві"""
+    for parent, child in _edge_directions(graph, from_vertex, to_vertex):
+        if (
+            previous.get(child) == parent
+            and distances[parent] + weight == distances[child]
+        ):
+            return child
+    return None
+
+
+class DynamicSSSP:
+    """
+    Дерево найкоротших шляхів від однієї вершини, яке оновлюється разом
+    з графом (спостерігач WeightedGraph).
+
+    - Нове ребро або зменшення ваги: якщо ребро скорочує шлях до вершини,
+      Дейкстра запускається лише від неї і зачіпає тільки покращені вершини.
+    - Видалення ребра або збільшення ваги: якщо ребро лежить на дереві,
+      піддерево під ним скидається, відстані до його вершин відновлюються
+      через ребра від решти дерева, і Дейкстра працює лише всередині піддерева.
+    """
+
+    def __init__(self, graph: WeightedGraph, source: str):
+        self.graph = graph
+        self.source = source
+        self.distances, self.previous = dijkstra(graph, source)
+        self.touched = 0  # Кількість вершин, оброблених останнім оновленням
+        graph.add_observer(self)
+
+    def path(self, target: str) -> Tuple[float, List[str]]:
+        """Відстань та найкоротший шлях до вершини target"""
+        distance = self.distances[target]
+        if distance == float("infinity"):
+            return distance, []
+        return distance, reconstruct_path(self.previous, self.source, target)
+
+    def vertex_added(self, vertex: str):
+        self.distances[vertex] = float("infinity")
+        self.previous[vertex] = None
+        self.touched = 0
+
+    def edge_added(self, from_vertex: str, to_vertex: str, weight: int):
+        self.touched = 0
+        self._relax_edge(from_vertex, to_vertex, weight)
+
+    def edge_removed(self, from_vertex: str, to_vertex: str, weight: int):
+        self.touched = 0
+        self._detach_edge(from_vertex, to_vertex, weight)
+
+    def edge_weight_changed(
+        self, from_vertex: str, to_vertex: str, old_weight: int, new_weight: int
+    ):
+        self.touched = 0
+        if new_weight > old_weight:
+            self._detach_edge(from_vertex, to_vertex, old_weight)
+        # Ребро з новою вагою могло залишитися найкращим для піддерева
+        self._relax_edge(from_vertex, to_vertex, new_weight)
+
+    def _relax_edge(self, from_vertex: str, to_vertex: str, weight: int):
+        """Якщо ребро скорочує шлях до кінця, поширює покращення"""
+        distances, previous = self.distances, self.previous
+        queue = []
+        for parent, child in _edge_directions(self.graph, from_vertex, to_vertex):
+            distance = distances[parent] + weight
+            if distance < distances[child]:
+                distances[child] = distance
+                previous[child] = parent
+                queue.append((distance, child))
+        self._propagate(queue)
+
+    def _detach_edge(self, from_vertex: str, to_vertex: str, weight: int):
+        """Якщо ребро лежить на дереві, перебудовує піддерево під ним"""
+        child = _tree_edge_child(
+            self.graph, self.distances, self.previous, from_vertex, to_vertex, weight
+        )
+        if child is not None:
+            self._rebuild_subtree(child)
+
+    def _rebuild_subtree(self, root: str):
+        """Скидає піддерево root і відновлює його від межі з рештою дерева"""
+        graph, distances, previous = self.graph, self.distances, self.previous
+        infinity = float("infinity")
+
+        # Піддерево: діти вершини є її сусідами, тому обходимо лише їх
+        subtree = {root}
+        stack = [root]
+        while stack:
+            vertex = stack.pop()
+            for neighbor, _ in graph.get_neighbors(vertex):
+                if neighbor not in subtree and previous[neighbor] == vertex:
+                    subtree.add(neighbor)
+                    stack.append(neighbor)
+        for vertex in subtree:
+            distances[vertex] = infinity
+            previous[vertex] = None
+
+        # Найкраще вхідне ребро від вершин поза піддеревом (їхні відстані точні)
+        queue = []
+        for vertex in subtree:
+            for neighbor, weight in graph.get_incoming(vertex):
+                if neighbor not in subtree:
+                    distance = distances[neighbor] + weight
+                    if distance < distances[vertex]:
+                        distances[vertex] = distance
+                        previous[vertex] = neighbor
+            if distances[vertex] != infinity:
+                queue.append((distances[vertex], vertex))
+        heapq.heapify(queue)
+        self._propagate(queue)
+        self.touched += len(subtree)
+
+    def _propagate(self, queue: List[Tuple[float, str]]):
+        """Дейкстра від вершин зі зменшеними відстанями"""
+        graph, distances, previous = self.graph, self.distances, self.previous
+        heapq.heapify(queue)
+        while queue:
+            current_distance, current = heapq.heappop(queue)
+            if current_distance > distances[current]:
+                continue
+            self.touched += 1
+            for neighbor, weight in graph.get_neighbors(current):
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    previous[neighbor] = current
+                    heapq.heappush(queue, (distance, neighbor))
+
+
+class LandmarkIndex:
+    """
+    Індекс ALT (A*, landmarks, triangle inequality) для неорієнтованого графа.
+
+    Для кожного з K орієнтирів L зберігається масив відстаней d(L, v) до всіх
+    вершин. За нерівністю трикутника |d(L, t) - d(L, v)| <= d(v, t), тому
+    максимум за орієнтирами - допустима та монотонна оцінка для A*.
+    """
+
+    MAGIC = b"ALT1"
+    HEADER = struct.Struct("<4sQQ")  # сигнатура, кількість вершин, K
+
+    def __init__(self, graph: FrozenGraph, landmarks: array, tables: List[array]):
+        self.graph = graph
+        self.landmarks = landmarks  # Ідентифікатори вершин-орієнтирів
+        self.tables = tables  # tables[i][v] = d(landmarks[i], v)
+        self.settled = 0  # Кількість оброблених вершин в останньому запиті
+
+    @classmethod
+    def build(
+        cls, graph: WeightedGraph, num_landmarks: int = 8, seed=None
+    ) -> "LandmarkIndex":
+        """
+        Вибір орієнтирів методом найвіддаленішої точки та обчислення таблиць.
+
+        Перший орієнтир - вершина, найвіддаленіша від випадкової; кожен
+        наступний - вершина з найбільшою відстанню до найближчого з уже
+        вибраних (недосяжні вершини обираються першими, щоб покрити всі
+        компоненти зв'язності).
+
+        Args:
+            graph: WeightedGraph або FrozenGraph
+            num_landmarks: Кількість орієнтирів K
+            seed: Початкове значення генератора випадкових чисел
+        """
+        frozen = graph if isinstance(graph, FrozenGraph) else graph.freeze()
+        if frozen.directed:
+            raise ValueError("ALT підтримує лише неорієнтовані графи")
+        n = frozen.num_vertices
+        landmarks = array("q")
+        tables: List[array] = []
+        if n == 0:
+            return cls(frozen, landmarks, tables)
+
+        start = frozen.names[random.Random(seed).randrange(n)]
+        distances, _ = dijkstra_frozen(frozen, start)
+        nearest = distances  # Відстань до найближчого орієнтира
+
+        for _ in range(min(num_landmarks, n)):
+            candidate = max(range(n), key=nearest.__getitem__)
+            if nearest[candidate] == 0:
+                break
+            distances, _ = dijkstra_frozen(frozen, frozen.names[candidate])
+            landmarks.append(candidate)
+            tables.append(array("d", distances))
+            nearest = [min(a, b) for a, b in zip(nearest, distances)]
+            # Вершини, що лишаються недосяжними, і далі матимуть infinity
+
+        return cls(frozen, landmarks, tables)
+
+    def lower_bound(self, vertex: str, target: str) -> float:
+        """Нижня оцінка відстані між двома вершинами за орієнтирами"""
+        v, t = self.graph.ids[vertex], self.graph.ids[target]
+        bound = 0.0
+        for table in self.tables:
+            if table[t] != float("infinity"):
+                bound = max(bound, abs(table[t] - table[v]))
+        return bound
+
+    def query(self, source: str, target: str) -> Tuple[float, List[str]]:
+        """
+        Найкоротший шлях A* з оцінкою за орієнтирами.
+
+        Returns:
+            Tuple (відстань, шлях); для недосяжної вершини - (infinity, [])
+        """
+        graph = self.graph
+        offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+        infinity = float("infinity")
+        s, t = graph.ids[source], graph.ids[target]
+        self.settled = 0
+
+        # Орієнтири з компоненти цілі; якщо source в іншій - шляху немає
+        active = []
+        for table in self.tables:
+            if (table[s] == infinity) != (table[t] == infinity):
+                return infinity, []
+            if table[t] != infinity:
+                active.append((table[t], table))
+
+        def heuristic(v: int) -> float:
+            bound = 0.0
+            for target_distance, table in active:
+                difference = abs(target_distance - table[v])
+                if difference > bound:
+                    bound = difference
+            return bound
+
+        distances = {s: 0}
+        previous: Dict[int, int] = {s: -1}
+        priority_queue = [(heuristic(s), 0, s)]
+
+        while priority_queue:
+            _, current_distance, current = heapq.heappop(priority_queue)
+            if current_distance > distances[current]:
+                continue
+            self.settled += 1
+
+            if current == t:
+                path = []
+                while current != -1:
+                    path.append(graph.names[current])
+                    current = previous[current]
+                path.reverse()
+                return current_distance, path
+
+            for index in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[index]
+                distance = current_distance + weights[index]
+                if distance < distances.get(neighbor, infinity):
+                    distances[neighbor] = distance
+                    previous[neighbor] = current
+                    heapq.heappush(
+                        priority_queue,
+                        (distance + heuristic(neighbor), distance, neighbor),
+                    )
+
+        return infinity, []
+
+    def save(self, path: str):
+        """Зберігає орієнтири та таблиці відстаней у бінарний файл"""
+        with open(path, "wb") as file:
+            file.write(
+                self.HEADER.pack(self.MAGIC, self.graph.num_vertices, len(self.tables))
+            )
+            self.landmarks.tofile(file)
+            for table in self.tables:
+                table.tofile(file)
+
+    @classmethod
+    def load(cls, path: str, graph: WeightedGraph) -> "LandmarkIndex":
+        """
+        Завантажує таблиці, збережені save, для того самого графа.
+
+        Raises:
+            ValueError: якщо файл має інший формат або інший розмір графа
+        """
+        frozen = graph if isinstance(graph, FrozenGraph) else graph.freeze()
+        with open(path, "rb") as file:
+            magic, num_vertices, count = cls.HEADER.unpack(file.read(cls.HEADER.size))
+            if magic != cls.MAGIC:
+                raise ValueError(f"{path}: невідомий формат файлу")
+            if num_vertices != frozen.num_vertices:
+                raise ValueError(
+                    f"{path}: таблиці для графа з {num_vertices} вершинами, "
+                    f"а граф має {frozen.num_vertices}"
+                )
+            landmarks = array("q")
+            landmarks.fromfile(file, count)
+            tables = []
+            for _ in range(count):
+                table = array("d")
+                table.fromfile(file, num_vertices)
+                tables.append(table)
+        return cls(frozen, landmarks, tables)
+
+
+class ContractionHierarchy:
+    """
+    Ієрархія стягувань (contraction hierarchies) для неорієнтованого графа.
+
+    Вершини стягуються по черзі; якщо найкоротший шлях між двома сусідами
+    стягнутої вершини v проходив через v, додається ярлик (shortcut) із
+    запам'ятаною серединою v. Запит - двонаправлений Дейкстра лише вгору
+    за рангом, після чого ярлики розгортаються у вихідні ребра.
+
+    Ребра "вгору" зберігаються у форматі CSR: up_targets, up_weights та
+    up_middles (-1 для вихідного ребра) для вершини i займають індекси
+    up_offsets[i]..up_offsets[i + 1] - 1.
+    """
+
+    def __init__(
+        self,
+        graph: FrozenGraph,
+        rank: array,
+        up_offsets: array,
+        up_targets: array,
+        up_weights: array,
+        up_middles: array,
+        shortcuts: int,
+    ):
+        self.graph = graph
+        self.rank = rank  # Порядковий номер стягування вершини
+        self.up_offsets = up_offsets
+        self.up_targets = up_targets
+        self.up_weights = up_weights
+        self.up_middles = up_middles
+        self.shortcuts = shortcuts  # Кількість доданих ярликів
+        self.settled = 0  # Кількість оброблених вершин в останньому запиті
+
+    @classmethod
+    def build(
+        cls, graph: WeightedGraph, witness_limit: int = 100
+    ) -> "ContractionHierarchy":
+        """
+        Передобробка: впорядкування вершин та додавання ярликів.
+
+        Пріоритет вершини - різниця ребер (кількість потрібних ярликів мінус
+        степінь) плюс кількість уже стягнутих сусідів; пріоритети
+        оновлюються ліниво - при вилученні з купи значення перераховується і,
+        якщо воно більше за наступне в купі, вершина повертається назад.
+
+        Args:
+            graph: WeightedGraph або FrozenGraph
+            witness_limit: Максимум вершин у пошуку свідка; якщо ліміт
+                вичерпано, ярлик додається (це не порушує точності)
+        """
+        frozen = graph if isinstance(graph, FrozenGraph) else graph.freeze()
+        if frozen.directed:
+            raise ValueError(
+                "Contraction hierarchies підтримують лише неорієнтовані графи"
+            )
+        n = frozen.num_vertices
+        integer_weights = frozen.weights.typecode == "q"
+
+        # Поточний граф ще не стягнутих вершин: сусід -> (вага, середина)
+        adjacency: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        for vertex in range(n):
+            edges = adjacency[vertex]
+            for index in range(frozen.offsets[vertex], frozen.offsets[vertex + 1]):
+                neighbor, weight = frozen.targets[index], frozen.weights[index]
+                if neighbor != vertex and weight < edges.get(neighbor, (math.inf,))[0]:
+                    edges[neighbor] = (weight, -1)
+
+        def needed_shortcuts(vertex: int) -> List[Tuple[int, int, float]]:
+            """Ярлики, потрібні при стягуванні вершини (пошук свідків)"""
+            edges = adjacency[vertex]
+            neighbors = sorted(edges)
+            result = []
+            for position, source in enumerate(neighbors[:-1]):
+                source_weight = edges[source][0]
+                targets = {
+                    target: source_weight + edges[target][0]
+                    for target in neighbors[position + 1 :]
+                }
+                limit = max(targets.values())
+
+                # Обмежений Дейкстра від source в обхід vertex
+                distances = {source: 0}
+                queue = [(0, source)]
+                remaining = len(targets)
+                settled = 0
+                while queue and remaining and settled < witness_limit:
+                    distance, current = heapq.heappop(queue)
+                    if distance > distances[current]:
+                        continue
+                    if distance > limit:
+                        break
+                    settled += 1
+                    if current in targets:
+                        remaining -= 1
+                    for neighbor, (weight, _) in adjacency[current].items():
+                        if neighbor == vertex:
+                            continue
+                        candidate = distance + weight
+                        if candidate < distances.get(neighbor, math.inf):
+                            distances[neighbor] = candidate
+                            heapq.heappush(queue, (candidate, neighbor))
+
+                for target, via in targets.items():
+                    if distances.get(target, math.inf) > via:
+                        result.append((source, target, via))
+            return result
+
+        contracted_neighbors = [0] * n
+
+        def priority(vertex: int, shortcuts_needed: list) -> int:
+            return (
+                len(shortcuts_needed)
+                - len(adjacency[vertex])
+                + contracted_neighbors[vertex]
+            )
+
+        queue = [
+            (priority(vertex, needed_shortcuts(vertex)), vertex) for vertex in range(n)
+        ]
+        heapq.heapify(queue)
+
+        rank = array("q", bytes(8 * n))
+        up_edges: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+        shortcuts = 0
+        order = 0
+        while queue:
+            _, vertex = heapq.heappop(queue)
+            candidates = needed_shortcuts(vertex)
+            current_priority = priority(vertex, candidates)
+            if queue and current_priority > queue[0][0]:
+                heapq.heappush(queue, (current_priority, vertex))
+                continue
+
+            for source, target, via in candidates:
+                if via < adjacency[source].get(target, (math.inf,))[0]:
+                    adjacency[source][target] = (via, vertex)
+                    adjacency[target][source] = (via, vertex)
+                    shortcuts += 1
+
+            rank[vertex] = order
+            order += 1
+            # Усі ребра стягнутої вершини ведуть до вершин з вищим рангом
+            for neighbor, (weight, middle) in adjacency[vertex].items():
+                up_edges[vertex].append((neighbor, weight, middle))
+                del adjacency[neighbor][vertex]
+                contracted_neighbors[neighbor] += 1
+            adjacency[vertex] = {}
+
+        up_offsets = array("q", [0])
+        up_targets = array("q")
+        up_weights = array("q" if integer_weights else "d")
+        up_middles = array("q")
+        for edges in up_edges:
+            for neighbor, weight, middle in edges:
+                up_targets.append(neighbor)
+                up_weights.append(weight)
+                up_middles.append(middle)
+            up_offsets.append(len(up_targets))
+
+        return cls(
+            frozen, rank, up_offsets, up_targets, up_weights, up_middles, shortcuts
+        )
+
+    def memory_usage(self) -> int:
+        """Приблизний обсяг пам'яті масивів ієрархії у байтах"""
+        return sum(
+            part.itemsize * len(part)
+            for part in (
+                self.rank,
+                self.up_offsets,
+                self.up_targets,
+                self.up_weights,
+                self.up_middles,
+            )
+        )
+
+    def _unpack(self, low: int, high: int, path: List[int]):
+        """Розгортає ребро (можливо, ярлик) low -> high у вихідні ребра"""
+        offsets, targets, middles = self.up_offsets, self.up_targets, self.up_middles
+        rank = self.rank
+        stack = [(low, high)]
+        while stack:
+            first, second = stack.pop()
+            # Ребро зберігається у вершини з меншим рангом
+            owner, other = (
+                (first, second) if rank[first] < rank[second] else (second, first)
+            )
+            middle = -1
+            for index in range(offsets[owner], offsets[owner + 1]):
+                if targets[index] == other:
+                    middle = middles[index]
+                    break
+            if middle == -1:
+                path.append(second)
+            else:
+                stack.append((middle, second))
+                stack.append((first, middle))
+
+    def query(self, source: str, target: str) -> Tuple[float, List[str]]:
+        """
+        Найкоротший шлях двонаправленим пошуком вгору за рангом.
+
+        Returns:
+            Tuple (відстань, шлях); для недосяжної вершини - (infinity, [])
+        """
+        graph = self.graph
+        offsets, targets, weights = self.up_offsets, self.up_targets, self.up_weights
+        infinity = float("infinity")
+        s, t = graph.ids[source], graph.ids[target]
+
+        distances = ({s: 0}, {t: 0})
+        previous: Tuple[Dict[int, int], Dict[int, int]] = ({s: -1}, {t: -1})
+        queues = ([(0, s)], [(0, t)])
+        best, meeting = (0, s) if s == t else (infinity, -1)
+        self.settled = 0
+
+        # Пошуки вгору не можна зупинити при першій зустрічі: кожна сторона
+        # працює, доки її мінімум у купі менший за найкращу знайдену відстань
+        for side in (0, 1):
+            own, other = distances[side], distances[1 - side]
+            queue, parents = queues[side], previous[side]
+            while queue and queue[0][0] < best:
+                distance, current = heapq.heappop(queue)
+                if distance > own[current]:
+                    continue
+                self.settled += 1
+                if current in other and distance + other[current] < best:
+                    best, meeting = distance + other[current], current
+                for index in range(offsets[current], offsets[current + 1]):
+                    neighbor = targets[index]
+                    candidate = distance + weights[index]
+                    if candidate < own.get(neighbor, infinity):
+                        own[neighbor] = candidate
+                        parents[neighbor] = current
+                        heapq.heappush(queue, (candidate, neighbor))
+
+        if meeting == -1:
+            return infinity, []
+
+        # Ланцюжки вершин у графі ієрархії: source -> meeting <- target
+        forward = [meeting]
+        while previous[0][forward[-1]] != -1:
+            forward.append(previous[0][forward[-1]])
+        forward.reverse()
+        backward = [meeting]
+        while previous[1][backward[-1]] != -1:
+            backward.append(previous[1][backward[-1]])
+        chain = forward + backward[1:]
+
+        path = [chain[0]]
+        for first, second in zip(chain, chain[1:]):
+            self._unpack(first, second, path)
+        return best, [graph.names[vertex] for vertex in path]
+
+
 def reconstruct_path(
     previous: Dict[str, Optional[str]], start_vertex: str, end_vertex: str
 ) -> List[str]:
@@ -139,6 +1475,106 @@ def reconstruct_path(
     return path
 
 
+def shortest_path(
+    graph: WeightedGraph, source: str, target: str, bidirectional: bool = False
+) -> Tuple[float, List[str]]:
+    """
+    Найкоротший шлях між двома вершинами.
+
+    На відміну від dijkstra, пошук зупиняється, щойно цільова вершина
+    оброблена, а відстані та попередники зберігаються лише для вершин,
+    яких торкнувся пошук.
+
+    Args:
+        graph: Зважений граф (WeightedGraph або FrozenGraph)
+        source: Початкова вершина
+        target: Кінцева вершина
+        bidirectional: Шукати одночасно з обох кінців (двонаправлена Дейкстра)
+
+    Returns:
+        Tuple (відстань, шлях); для недосяжної вершини - (infinity, [])
+    """
+    if bidirectional:
+        return _bidirectional_dijkstra(graph, source, target)
+
+    distances = {source: 0}
+    previous: Dict[str, Optional[str]] = {source: None}
+    priority_queue = [(0, source)]
+
+    while priority_queue:
+        current_distance, current_vertex = heapq.heappop(priority_queue)
+        if current_distance > distances[current_vertex]:
+            continue
+
+        # Ціль оброблено - її відстань остаточна
+        if current_vertex == target:
+            return current_distance, reconstruct_path(previous, source, target)
+
+        for neighbor, weight in graph.get_neighbors(current_vertex):
+            distance = current_distance + weight
+            if distance < distances.get(neighbor, float("infinity")):
+                distances[neighbor] = distance
+                previous[neighbor] = current_vertex
+                heapq.heappush(priority_queue, (distance, neighbor))
+
+    return float("infinity"), []
+
+
+def _bidirectional_dijkstra(
+    graph: WeightedGraph, source: str, target: str
+) -> Tuple[float, List[str]]:
+    """
+    Двонаправлена Дейкстра: прямий пошук від source і зворотний від target.
+
+    На кожному кроці розширюється фронт з меншою відстанню на вершині купи.
+    best - довжина найкращого знайденого шляху через ребро між фронтами;
+    пошук зупиняється, коли сума мінімумів обох куп не менша за best.
+    """
+    if source == target:
+        return 0, [source]
+
+    distances = ({source: 0}, {target: 0})
+    previous: Tuple[Dict[str, Optional[str]], ...] = ({source: None}, {target: None})
+    queues = ([(0, source)], [(0, target)])
+    best = float("infinity")
+    meeting = None
+
+    while queues[0] and queues[1]:
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        # Розширюємо фронт з меншою відстанню
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        own, other = distances[side], distances[1 - side]
+        current_distance, current_vertex = heapq.heappop(queues[side])
+        if current_distance > own[current_vertex]:
+            continue
+
+        # Зворотний пошук іде по вхідних ребрах (важливо для орієнтованого графа)
+        edges = graph.get_neighbors if side == 0 else graph.get_incoming
+        for neighbor, weight in edges(current_vertex):
+            distance = current_distance + weight
+            if distance < own.get(neighbor, float("infinity")):
+                own[neighbor] = distance
+                previous[side][neighbor] = current_vertex
+                heapq.heappush(queues[side], (distance, neighbor))
+            # Шлях через ребро між фронтами
+            if neighbor in other and distance + other[neighbor] < best:
+                best = distance + other[neighbor]
+                meeting = neighbor
+
+    if meeting is None:
+        return float("infinity"), []
+
+    # Склеюємо шлях: source -> meeting та meeting -> target
+    path = reconstruct_path(previous[0], source, meeting)
+    current = previous[1][meeting]
+    while current is not None:
+        path.append(current)
+        current = previous[1][current]
+    return best, path
+
+
 def print_shortest_paths(graph: WeightedGraph, start_vertex: str):
     """
     Виводить найкоротші шляхи від початкової вершини до всіх інших.
@@ -188,6 +1624,744 @@ def create_example_graph1() -> WeightedGraph:
     return graph
 
 
+def create_random_graph(
+    num_vertices: int, num_edges: int, max_weight: int = 100, seed=None
+) -> WeightedGraph:
+    """
+    Створює випадковий зв'язний граф: остовне дерево плюс випадкові ребра.
+
+    Args:
+        num_vertices: Кількість вершин
+        num_edges: Кількість ребер (не менше num_vertices - 1)
+        max_weight: Максимальна вага ребра
+        seed: Початкове значення генератора випадкових чисел
+    """
+    rng = random.Random(seed)
+    graph = WeightedGraph()
+    names = [f"v{index}" for index in range(num_vertices)]
+    for name in names:
+        graph.add_vertex(name)
+
+    for index in range(1, num_vertices):
+        graph.add_edge(
+            names[rng.randrange(index)], names[index], rng.randint(1, max_weight)
+        )
+    for _ in range(max(num_edges - (num_vertices - 1), 0)):
+        graph.add_edge(
+            names[rng.randrange(num_vertices)],
+            names[rng.randrange(num_vertices)],
+            rng.randint(1, max_weight),
+        )
+    return graph
+
+
+def create_grid_graph(
+    rows: int, cols: int, max_weight: int = 10, seed=None
+) -> WeightedGraph:
+    """
+    Створює граф-решітку rows x cols (схожий на дорожню мережу)
+    з випадковими вагами ребер. Вершини мають імена "r,c".
+    """
+    rng = random.Random(seed)
+    graph = WeightedGraph()
+    for row in range(rows):
+        for col in range(cols):
+            graph.add_vertex(f"{row},{col}")
+            if row:
+                graph.add_edge(
+                    f"{row - 1},{col}", f"{row},{col}", rng.randint(1, max_weight)
+                )
+            if col:
+                graph.add_edge(
+                    f"{row},{col - 1}", f"{row},{col}", rng.randint(1, max_weight)
+                )
+    return graph
+
+
+def create_random_geometric_graph(
+    num_vertices: int, radius: float = 0.02, seed=None
+) -> WeightedGraph:
+    """
+    Створює випадковий геометричний граф: точки в одиничному квадраті,
+    ребро між точками на відстані не більше radius, вага - відстань
+    у тисячних частках (ціле число не менше 1). Вершини мають імена "p{i}".
+    """
+    rng = random.Random(seed)
+    points = [(rng.random(), rng.random()) for _ in range(num_vertices)]
+    graph = WeightedGraph()
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    for index, (x, y) in enumerate(points):
+        graph.add_vertex(f"p{index}")
+        cells.setdefault((int(x / radius), int(y / radius)), []).append(index)
+
+    # Сусідів шукаємо лише у сусідніх клітинках сітки з кроком radius
+    for (cell_x, cell_y), members in cells.items():
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for other in cells.get((cell_x + dx, cell_y + dy), ()):
+                    for index in members:
+                        if index < other:
+                            length = math.dist(points[index], points[other])
+                            if length <= radius:
+                                graph.add_edge(
+                                    f"p{index}",
+                                    f"p{other}",
+                                    max(1, round(length * 1000)),
+                                )
+    return graph
+
+
+def load_edge_list(
+    path: str,
+    directed: bool = False,
+    delimiter: Optional[str] = None,
+    frozen: bool = False,
+    chunk_size: int = 1 << 22,
+    verbose: bool = False,
+    header: Optional[bool] = None,
+):
+    """
+    Потокове завантаження графа зі списку ребер CSV/TSV.
+
+    Кожен рядок - "початок, кінець[, вага]" (без ваги - 1). Рядки з "#"
+    пропускаються, як і заголовок (див. header). Файл читається пачками
+    рядків по chunk_size байтів, імена вершин зберігаються один раз, а
+    ребра накопичуються в масивах з цілими ідентифікаторами.
+
+    Args:
+        path: Шлях до файлу
+        directed: Орієнтований граф (інакше ребро додається в обидва боки)
+        delimiter: Роздільник; None - за розширенням (.csv - кома,
+            .tsv - табуляція), для інших файлів - пробіли
+        frozen: Повернути FrozenGraph замість WeightedGraph
+        chunk_size: Розмір пачки рядків у байтах
+        verbose: Вивести кількість ребер і швидкість завантаження
+        header: Чи є перший рядок даних заголовком; None - визначити за
+            рядком цілком: заголовок, якщо вага в ньому не число або всі
+            поля - типові назви стовпців ("source", "target", "weight", ...)
+
+    Raises:
+        ValueError: якщо вагу ребра не вдалося розібрати
+    """
+    if delimiter is None:
+        delimiter = {".csv": ",", ".tsv": "\t"}.get(os.path.splitext(path)[1])
+    start = time.perf_counter()
+    ids: Dict[str, int] = {}  # Ім'я -> ідентифікатор (порядок появи)
+    sources, targets, weights = array("q"), array("q"), array("q")
+
+    for lines in _read_chunks(path, chunk_size):
+        for line in lines:
+            fields = line.split(delimiter)
+            if len(fields) < 2 or fields[0][:1] == "#":
+                continue
+            if header is not False:
+                # Рішення приймається один раз - для першого рядка даних
+                is_header = header or _is_edge_list_header(fields)
+                header = False
+                if is_header:
+                    continue
+            text = fields[2].strip() if len(fields) > 2 else "1"
+            try:
+                weight = int(text)
+            except ValueError:
+                try:
+                    weight = float(text)
+                except ValueError:
+                    raise ValueError(f"{path}: некоректна вага ребра {text!r}")
+                if weights.typecode == "q":
+                    weights = array("d", weights)
+
+            sources.append(ids.setdefault(fields[0].strip(), len(ids)))
+            targets.append(ids.setdefault(fields[1].strip(), len(ids)))
+            weights.append(weight)
+
+    return _build_loaded_graph(
+        path, list(ids), sources, targets, weights, directed, frozen, start, verbose
+    )
+
+
+# Типові назви стовпців заголовка списку ребер
+_EDGE_LIST_COLUMNS = set(
+    "source target src dst from to node1 node2 weight cost length distance".split()
+)
+
+
+def _is_edge_list_header(fields: List[str]) -> bool:
+    """Чи схожий перший рядок даних (розбитий на поля) на заголовок"""
+    if len(fields) > 2:
+        try:
+            float(fields[2])
+        except ValueError:
+            return True
+    return all(field.strip().lower() in _EDGE_LIST_COLUMNS for field in fields)
+
+
+def load_dimacs(
+    path: str,
+    directed: bool = True,
+    frozen: bool = False,
+    chunk_size: int = 1 << 22,
+    verbose: bool = False,
+):
+    """
+    Потокове завантаження графа у форматі DIMACS (.gr, 9th DIMACS Challenge).
+
+    Рядок "p sp n m" задає кількість вершин (імена "1".."n"), рядки
+    "a u v w" - дуги. У файлах DIMACS дороги зазвичай записані двома дугами,
+    тому за замовчуванням граф орієнтований.
+
+    Args:
+        path: Шлях до файлу
+        directed: Орієнтований граф (інакше кожна дуга додається в обидва боки)
+        frozen: Повернути FrozenGraph замість WeightedGraph
+        chunk_size: Розмір пачки рядків у байтах
+        verbose: Вивести кількість ребер і швидкість завантаження
+
+    Raises:
+        ValueError: якщо рядка "p sp n m" немає перед дугами, або дуга не має
+            рівно трьох цілих полів, або номер вершини поза межами 1..n
+    """
+    start = time.perf_counter()
+    names: Optional[List[str]] = None
+    sources, targets, weights = array("q"), array("q"), array("q")
+
+    for lines in _read_chunks(path, chunk_size):
+        if names is None:
+            for line in lines:
+                if line[:1] == "a":
+                    break
+                if line[:1] == "p":
+                    fields = line.split()
+                    if len(fields) != 4 or not fields[2].isdigit():
+                        raise ValueError(f"{path}: некоректний рядок {line.strip()!r}")
+                    names = [str(vertex) for vertex in range(1, int(fields[2]) + 1)]
+                    break
+
+        arc_lines = [line[1:] for line in lines if line[:1] == "a"]
+        if not arc_lines:
+            continue
+        if names is None:
+            raise ValueError(f"{path}: немає рядка 'p sp n m' перед дугами")
+        arcs = _parse_dimacs_arcs(path, arc_lines, len(names))
+        sources.frombytes((arcs[:, 0] - 1).tobytes())
+        targets.frombytes((arcs[:, 1] - 1).tobytes())
+        weights.frombytes(arcs[:, 2].tobytes())
+
+    if names is None:
+        raise ValueError(f"{path}: немає рядка 'p sp n m'")
+    return _build_loaded_graph(
+        path, names, sources, targets, weights, directed, frozen, start, verbose
+    )
+
+
+def _parse_dimacs_arcs(path: str, arc_lines: List[str], num_vertices: int):
+    """
+    Розбирає дуги пачки ("u v w" без префікса "a") у масив (k, 3).
+
+    Перевірки векторизовані: кількість полів кожного рядка рахується за
+    байтами тексту, числа розбирає numpy одним викликом, а рядок з помилкою
+    шукається лише тоді, коли перевірка не пройшла.
+    """
+    import numpy as np
+
+    text = "".join(arc_lines)
+    if not text.endswith("\n"):
+        text += "\n"
+
+    # Поле починається з непробільного байта після пробільного
+    data = np.frombuffer(text.encode(), dtype=np.uint8)
+    space = data <= 32
+    starts = ~space & np.concatenate(([True], space[:-1]))
+    newline = data == 10
+    line_of = np.cumsum(newline) - newline
+    counts = np.bincount(line_of[starts], minlength=len(arc_lines))
+    bad = np.flatnonzero(counts != 3)
+    if bad.size:
+        line = arc_lines[bad[0]].strip()
+        raise ValueError(f"{path}: дуга має бути 'a u v w', отримано 'a {line}'")
+
+    try:
+        arcs = np.fromstring(text, dtype=np.int64, sep=" ").reshape(-1, 3)
+    except ValueError:  # Старіші версії numpy лише попереджають і обривають
+        arcs = np.empty((0, 3), dtype=np.int64)
+    if len(arcs) != len(arc_lines):
+        for line in arc_lines:
+            if not all(field.lstrip("-").isdigit() for field in line.split()):
+                break
+        raise ValueError(f"{path}: поля дуги мають бути цілими: 'a {line.strip()}'")
+
+    ids = arcs[:, :2]
+    bad = np.flatnonzero(((ids < 1) | (ids > num_vertices)).any(axis=1))
+    if bad.size:
+        line = arc_lines[bad[0]].strip()
+        raise ValueError(
+            f"{path}: вершина дуги поза межами 1..{num_vertices}: 'a {line}'"
+        )
+    return arcs
+
+
+def _read_chunks(path: str, chunk_size: int):
+    """Рядки файлу пачками приблизно по chunk_size байтів"""
+    with open(path, "r", encoding="utf-8", buffering=chunk_size) as file:
+        while True:
+            lines = file.readlines(chunk_size)
+            if not lines:
+                return
+            yield lines
+
+
+def _build_loaded_graph(
+    path, names, sources, targets, weights, directed, frozen, start, verbose
+):
+    """Будує граф з масивів ребер і звітує про швидкість завантаження"""
+    if frozen:
+        graph = _csr_from_edges(names, sources, targets, weights, directed)
+    else:
+        graph = WeightedGraph.from_edges(names, sources, targets, weights, directed)
+    if verbose:
+        elapsed = time.perf_counter() - start
+        print(
+            f"{path}: {len(sources):,} ребер, {len(names):,} вершин "
+            f"за {elapsed:.2f} с ({len(sources) / max(elapsed, 1e-9):,.0f} ребер/с)"
+        )
+    return graph
+
+
+def benchmark_frozen_graph(num_vertices: int = 200_000, num_edges: int = 1_000_000):
+    """
+    Порівняння пам'яті та часу Дейкстри для WeightedGraph і FrozenGraph.
+
+    Args:
+        num_vertices: Кількість вершин
+        num_edges: Кількість ребер
+    """
+    print(
+        f"WeightedGraph проти FrozenGraph "
+        f"({num_vertices:,} вершин, {num_edges:,} ребер)"
+    )
+    print("-" * 70)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    graph = create_random_graph(num_vertices, num_edges, seed=1)
+    build_time = time.perf_counter() - start
+    graph_memory = tracemalloc.get_traced_memory()[0]
+
+    start = time.perf_counter()
+    frozen = graph.freeze()
+    freeze_time = time.perf_counter() - start
+    frozen_memory = tracemalloc.get_traced_memory()[0] - graph_memory
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    distances, _ = dijkstra(graph, "v0")
+    dict_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    frozen_distances, _ = dijkstra_frozen(frozen, "v0")
+    frozen_time = time.perf_counter() - start
+
+    assert all(
+        distances[name] == frozen_distances[index]
+        for index, name in enumerate(frozen.names)
+    )
+    row = "{:<16}{:>14}{:>14}{:>14}"
+    print(row.format("", "Пам'ять, МБ", "Побудова, с", "Дейкстра, с"))
+    for title, memory, build, search in (
+        ("WeightedGraph", graph_memory, build_time, dict_time),
+        ("FrozenGraph", frozen_memory, freeze_time, frozen_time),
+    ):
+        print(
+            row.format(title, f"{memory / 2**20:.1f}", f"{build:.2f}", f"{search:.2f}")
+        )
+
+
+def benchmark_point_to_point(
+    num_vertices: int = 100_000, num_edges: int = 300_000, queries: int = 50
+):
+    """
+    Порівняння запитів між двома вершинами: повна dijkstra + reconstruct_path,
+    shortest_path з раннім завершенням та двонаправлений пошук.
+    """
+    graph = create_random_graph(num_vertices, num_edges, seed=2)
+    rng = random.Random(3)
+    pairs = [
+        (f"v{rng.randrange(num_vertices)}", f"v{rng.randrange(num_vertices)}")
+        for _ in range(queries)
+    ]
+
+    def full(source, target):
+        distances, previous = dijkstra(graph, source)
+        return distances[target], reconstruct_path(previous, source, target)
+
+    print(
+        f"Запити між двома вершинами ({num_vertices:,} вершин, "
+        f"{num_edges:,} ребер, {queries} запитів)"
+    )
+    print("-" * 70)
+    reference = None
+    for title, query in (
+        ("dijkstra + reconstruct_path", full),
+        ("shortest_path", lambda s, t: shortest_path(graph, s, t)),
+        (
+            "shortest_path (двонаправлений)",
+            lambda s, t: shortest_path(graph, s, t, True),
+        ),
+    ):
+        start = time.perf_counter()
+        lengths = [query(source, target)[0] for source, target in pairs]
+        elapsed = time.perf_counter() - start
+        if reference is None:
+            reference = lengths
+        assert lengths == reference
+        print(f"{title:<34}{elapsed / queries * 1000:>10.2f} мс/запит")
+
+
+def benchmark_landmarks(side: int = 200, queries: int = 50, ks=(1, 2, 4, 8, 16)):
+    """
+    Час передобробки ALT та прискорення запитів залежно від кількості
+    орієнтирів K на решітці side x side.
+    """
+    graph = create_grid_graph(side, side, seed=4)
+    frozen = graph.freeze()
+    rng = random.Random(5)
+    pairs = [
+        (rng.choice(frozen.names), rng.choice(frozen.names)) for _ in range(queries)
+    ]
+
+    start = time.perf_counter()
+    reference = [shortest_path(frozen, source, target)[0] for source, target in pairs]
+    baseline = (time.perf_counter() - start) / queries
+
+    print(f"ALT на решітці {side}x{side}, {queries} запитів")
+    print("-" * 70)
+    print(f"shortest_path (без оцінки): {baseline * 1000:.2f} мс/запит")
+    row = "{:>4}{:>16}{:>16}{:>16}{:>14}"
+    print(row.format("K", "Передобр., с", "Запит, мс", "Вершин/запит", "Прискор."))
+    for k in ks:
+        start = time.perf_counter()
+        index = LandmarkIndex.build(frozen, k, seed=6)
+        build_time = time.perf_counter() - start
+
+        settled = 0
+        start = time.perf_counter()
+        for (source, target), expected in zip(pairs, reference):
+            assert index.query(source, target)[0] == expected
+            settled += index.settled
+        query_time = (time.perf_counter() - start) / queries
+        print(
+            row.format(
+                k,
+                f"{build_time:.2f}",
+                f"{query_time * 1000:.2f}",
+                settled // queries,
+                f"{baseline / query_time:.1f}x",
+            )
+        )
+
+
+def benchmark_contraction_hierarchy(queries: int = 100):
+    """
+    Час передобробки, пам'ять та затримка запитів ContractionHierarchy
+    порівняно з dijkstra та shortest_path на решітці та геометричному графі.
+    """
+    families = (
+        ("решітка 100x100", create_grid_graph(100, 100, seed=7)),
+        ("геометричний, 5 000", create_random_geometric_graph(5_000, 0.025, seed=8)),
+    )
+    for title, graph in families:
+        frozen = graph.freeze()
+        rng = random.Random(9)
+        pairs = [
+            (rng.choice(frozen.names), rng.choice(frozen.names)) for _ in range(queries)
+        ]
+
+        start = time.perf_counter()
+        hierarchy = ContractionHierarchy.build(frozen)
+        build_time = time.perf_counter() - start
+
+        print(f"Contraction hierarchies: {title}, {queries} запитів")
+        print("-" * 70)
+        print(f"Передобробка: {build_time:.2f} с, ярликів: {hierarchy.shortcuts:,}")
+        print(
+            f"Пам'ять: граф {frozen.memory_usage() / 2**20:.2f} МБ, "
+            f"ієрархія {hierarchy.memory_usage() / 2**20:.2f} МБ"
+        )
+
+        reference = None
+        for name, query in (
+            ("dijkstra", lambda s, t: dijkstra(graph, s)[0][t]),
+            (
+                "shortest_path (двонаправлений)",
+                lambda s, t: shortest_path(frozen, s, t, True)[0],
+            ),
+            ("ContractionHierarchy.query", lambda s, t: hierarchy.query(s, t)[0]),
+        ):
+            start = time.perf_counter()
+            lengths = [query(source, target) for source, target in pairs]
+            elapsed = time.perf_counter() - start
+            if reference is None:
+                reference = lengths
+            assert lengths == reference
+            print(f"{name:<34}{elapsed / queries * 1000:>10.3f} мс/запит")
+        print()
+
+
+def benchmark_priority_queues(queries: int = 3):
+    """
+    Матриця часу dijkstra для різних черг з пріоритетом за сімействами
+    графів та розподілами ваг ребер.
+    """
+    families = (
+        ("випадковий 50k", create_random_graph(50_000, 200_000, seed=10)),
+        ("решітка 200x200", create_grid_graph(200, 200, seed=11)),
+        ("геометричний 20k", create_random_geometric_graph(20_000, 0.012, seed=12)),
+    )
+    distributions = (
+        ("1", lambda rng: 1),
+        ("1..10", lambda rng: rng.randint(1, 10)),
+        ("1..1000", lambda rng: rng.randint(1, 1000)),
+        ("1..10^6", lambda rng: rng.randint(1, 10**6)),
+        ("[0, 1)", lambda rng: rng.random()),
+    )
+    backends = ("heap", "dial", "radix", "dary")
+
+    print(f"Черги з пріоритетом: середній час dijkstra, мс ({queries} запуски)")
+    print("-" * 78)
+    row = "{:<18}{:<9}" + "{:>9}" * len(backends) + "{:>9}"
+    print(row.format("Граф", "Ваги", *backends, "auto"))
+    for family, template in families:
+        for title, weight in distributions:
+            # Та сама топологія з новими вагами
+            rng = random.Random(13)
+            graph = WeightedGraph()
+            for vertex in template.get_vertices():
+                graph.add_vertex(vertex)
+                for neighbor, _ in template.get_neighbors(vertex):
+                    if vertex < neighbor:
+                        graph.add_edge(vertex, neighbor, weight(rng))
+            sources = random.Random(14).sample(graph.get_vertices(), queries)
+
+            timings = {}
+            for backend in backends + ("auto",):
+                if backend in ("dial", "radix") and not graph.integer_weights:
+                    timings[backend] = "-"
+                    continue
+                if backend == "dial" and graph.max_weight > 100 * DIAL_MAX_WEIGHT:
+                    timings[backend] = "-"  # Забагато кошиків
+                    continue
+                start = time.perf_counter()
+                for source in sources:
+                    dijkstra(graph, source, backend)
+                elapsed = (time.perf_counter() - start) / queries
+                timings[backend] = f"{elapsed * 1000:.0f}"
+            print(
+                row.format(
+                    family, title, *(timings[b] for b in backends), timings["auto"]
+                )
+            )
+
+
+def benchmark_dijkstra_many(
+    num_vertices: int = 50_000,
+    num_edges: int = 200_000,
+    sources: int = 32,
+    max_workers=None,
+):
+    """
+    Матриця відстаней від багатьох джерел: цикл dijkstra зі словниками
+    проти dijkstra_many з різною кількістю процесів.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    graph = create_random_graph(num_vertices, num_edges, seed=15)
+    frozen = graph.freeze()
+    names = random.Random(16).sample(frozen.names, sources)
+
+    print(
+        f"Відстані від {sources} джерел ({num_vertices:,} вершин, "
+        f"{num_edges:,} ребер, ядер: {os.cpu_count()})"
+    )
+    print("-" * 70)
+    start = time.perf_counter()
+    tables = [dijkstra(graph, source)[0] for source in names]
+    loop_time = time.perf_counter() - start
+    print(f"{'Цикл dijkstra':<26}{loop_time:>10.2f} с")
+
+    for workers in range(1, max_workers + 1):
+        start = time.perf_counter()
+        matrix = dijkstra_many(frozen, names, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert all(
+            matrix[row, frozen.ids[vertex]] == distance
+            for row, table in enumerate(tables)
+            for vertex, distance in list(table.items())[:100]
+        )
+        title = f"dijkstra_many, {workers} пр."
+        print(f"{title:<26}{elapsed:>10.2f} с{loop_time / elapsed:>10.2f}x")
+    print(f"Розмір матриці: {matrix.nbytes / 2**20:.1f} МБ")
+
+
+def benchmark_path_cache(
+    num_vertices: int = 10_000, num_edges: int = 30_000, queries: int = 500
+):
+    """
+    Запити від невеликого набору "гарячих" джерел на графі, що поступово
+    змінюється: dijkstra для кожного запиту проти ShortestPathCache.
+    """
+    graph = create_random_graph(num_vertices, num_edges, seed=17)
+    rng = random.Random(18)
+    hot = [f"v{rng.randrange(num_vertices)}" for _ in range(16)]
+    # Кожен 50-й запит - нове ребро з великою вагою (рідко щось покращує)
+    operations = [
+        (
+            (
+                "edge",
+                f"v{rng.randrange(num_vertices)}",
+                f"v{rng.randrange(num_vertices)}",
+            )
+            if index % 50 == 49
+            else (
+                "query",
+                hot[min(int(rng.expovariate(0.4)), 15)],
+                f"v{rng.randrange(num_vertices)}",
+            )
+        )
+        for index in range(queries)
+    ]
+
+    def run(cache_size: int = 0):
+        working = WeightedGraph()
+        for vertex in graph.get_vertices():
+            for neighbor, weight in graph.get_neighbors(vertex):
+                if vertex < neighbor:
+                    working.add_edge(vertex, neighbor, weight)
+        cache = ShortestPathCache(working, cache_size) if cache_size else None
+        lengths = []
+        start = time.perf_counter()
+        for kind, first, second in operations:
+            if kind == "edge":
+                working.add_edge(first, second, 80)
+            elif cache is None:
+                lengths.append(dijkstra(working, first)[0][second])
+            else:
+                lengths.append(cache.path(first, second)[0])
+        return time.perf_counter() - start, lengths, cache
+
+    print(f"Кеш найкоротших шляхів ({num_vertices:,} вершин, {queries:,} операцій)")
+    print("-" * 70)
+    plain_time, expected, _ = run()
+    print(f"{'Без кешу':<20}{plain_time:>10.2f} с")
+    for size in (4, 8, 16):
+        elapsed, lengths, cache = run(size)
+        assert lengths == expected
+        print(
+            f"{'LRU на ' + str(size):<20}{elapsed:>10.2f} с"
+            f"{plain_time / elapsed:>8.1f}x  влучань: {cache.hits}, "
+            f"промахів: {cache.misses}, витіснень: {cache.evictions}, "
+            f"інвалідацій: {cache.invalidations}"
+        )
+
+
+def benchmark_dynamic_sssp(sizes=(10_000, 50_000, 100_000), updates: int = 200):
+    """
+    Середня затримка оновлення DynamicSSSP (додавання, зменшення ваги,
+    збільшення ваги та видалення ребер) порівняно з повним запуском dijkstra.
+    """
+    print(f"Динамічне дерево найкоротших шляхів ({updates} змін)")
+    print("-" * 70)
+    row = "{:>10}{:>16}{:>18}{:>14}{:>12}"
+    print(
+        row.format("Вершин", "dijkstra, мс", "Оновлення, мс", "Вершин/зм.", "Прискор.")
+    )
+    for num_vertices in sizes:
+        graph = create_random_graph(num_vertices, 3 * num_vertices, seed=19)
+        rng = random.Random(20)
+        start = time.perf_counter()
+        dynamic = DynamicSSSP(graph, "v0")
+        full_time = time.perf_counter() - start
+
+        touched = 0
+        start = time.perf_counter()
+        for index in range(updates):
+            vertex = f"v{rng.randrange(num_vertices)}"
+            neighbor, weight = rng.choice(graph.get_neighbors(vertex))
+            kind = index % 4
+            if kind == 0:
+                graph.add_edge(
+                    vertex, f"v{rng.randrange(num_vertices)}", rng.randint(1, 100)
+                )
+            elif kind == 1:
+                graph.set_edge_weight(vertex, neighbor, weight // 2)
+            elif kind == 2:
+                graph.set_edge_weight(vertex, neighbor, weight * 2)
+            elif len(graph.get_neighbors(vertex)) > 1:
+                graph.remove_edge(vertex, neighbor)
+            touched += dynamic.touched
+        update_time = (time.perf_counter() - start) / updates
+
+        assert dynamic.distances == dijkstra(graph, "v0")[0]
+        print(
+            row.format(
+                f"{num_vertices:,}",
+                f"{full_time * 1000:.1f}",
+                f"{update_time * 1000:.3f}",
+                touched // updates,
+                f"{full_time / update_time:.0f}x",
+            )
+        )
+
+
+def benchmark_loader(num_vertices: int = 100_000, num_edges: int = 1_000_000):
+    """
+    Швидкість завантаження графа з файлу: читання CSV з add_edge для кожного
+    ребра проти load_edge_list та load_dimacs (WeightedGraph і FrozenGraph).
+    """
+    rng = random.Random(21)
+    edges = [
+        (rng.randrange(num_vertices), rng.randrange(num_vertices), rng.randint(1, 100))
+        for _ in range(num_edges)
+    ]
+
+    with tempfile.TemporaryDirectory(prefix="graph-") as directory:
+        csv_path = os.path.join(directory, "edges.csv")
+        dimacs_path = os.path.join(directory, "edges.gr")
+        with open(csv_path, "w", encoding="utf-8") as file:
+            file.write("source,target,weight\n")
+            file.writelines(f"v{u},v{v},{w}\n" for u, v, w in edges)
+        with open(dimacs_path, "w", encoding="utf-8") as file:
+            file.write(f"c випадковий граф\np sp {num_vertices} {num_edges}\n")
+            file.writelines(f"a {u + 1} {v + 1} {w}\n" for u, v, w in edges)
+
+        def add_edge_loop():
+            graph = WeightedGraph()
+            with open(csv_path, encoding="utf-8") as file:
+                next(file)
+                for line in file:
+                    source, target, weight = line.split(",")
+                    graph.add_edge(source, target, int(weight))
+            return graph
+
+        print(f"Завантаження графа з файлу ({num_edges:,} ребер)")
+        print("-" * 70)
+        for title, load in (
+            ("CSV + add_edge", add_edge_loop),
+            ("load_edge_list", lambda: load_edge_list(csv_path)),
+            ("load_edge_list, frozen", lambda: load_edge_list(csv_path, frozen=True)),
+            (
+                "load_dimacs, frozen",
+                lambda: load_dimacs(dimacs_path, directed=False, frozen=True),
+            ),
+        ):
+            start = time.perf_counter()
+            graph = load()
+            elapsed = time.perf_counter() - start
+            # Імена вершин у форматах різні, тому звіряємо кількість ребер
+            entries = sum(len(graph.get_neighbors(v)) for v in graph.get_vertices())
+            assert entries == 2 * num_edges
+            print(f"{title:<26}{elapsed:>8.2f} с{num_edges / elapsed:>16,.0f} ребер/с")
+
+
 def demonstrate_algorithm_steps(graph: WeightedGraph, start_vertex: str):
     """
     Демонструє покрокову роботу алгоритму Дейкстри.
@@ -257,6 +2431,26 @@ def demonstrate_algorithm_steps(graph: WeightedGraph, start_vertex: str):
 
 
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        benchmark_frozen_graph()
+        print()
+        benchmark_point_to_point()
+        print()
+        benchmark_landmarks()
+        print()
+        benchmark_contraction_hierarchy()
+        print()
+        benchmark_priority_queues()
+        print()
+        benchmark_dijkstra_many()
+        print()
+        benchmark_path_cache()
+        print()
+        benchmark_dynamic_sssp()
+        print()
+        benchmark_loader()
+        sys.exit(0)
+
     # Приклад 1: Простий граф з літерами
     print("\n" + "=" * 70)
     print("ПРИКЛАД 1: Простий граф")
@@ -269,3 +2463,121 @@ if __name__ == "__main__":
 
     # Покрокова демонстрація на простому графі
     demonstrate_algorithm_steps(graph1, "A")
+
+    # Приклад 2: Той самий граф у компактному форматі CSR
+    print("\n" + "=" * 70)
+    print("ПРИКЛАД 2: FrozenGraph (CSR) з цілими ідентифікаторами вершин")
+    print("=" * 70)
+
+    frozen1 = graph1.freeze()
+    print(
+        f"Вершин: {frozen1.num_vertices}, записів суміжності: {frozen1.num_edges}, "
+        f"масиви CSR: {frozen1.memory_usage()} байт"
+    )
+    frozen_distances, frozen_previous = dijkstra_frozen(frozen1, "A")
+    for index, vertex in enumerate(frozen1.names):
+        path = reconstruct_path_frozen(frozen1, frozen_previous, "A", vertex)
+        print(
+            f"Вершина {vertex}: відстань = {frozen_distances[index]}, "
+            f"шлях: {' → '.join(path)}"
+        )
+
+    # Приклад 3: Запити між двома вершинами
+    print("\n" + "=" * 70)
+    print("ПРИКЛАД 3: Найкоротший шлях між двома вершинами")
+    print("=" * 70)
+
+    for bidirectional in (False, True):
+        distance, path = shortest_path(graph1, "A", "F", bidirectional)
+        mode = "двонаправлений" if bidirectional else "з раннім завершенням"
+        print(f"A → F ({mode}): відстань = {distance}, шлях: {' → '.join(path)}")
+
+    # Приклад 4: A* з орієнтирами (ALT)
+    print("\n" + "=" * 70)
+    print("ПРИКЛАД 4: A* з орієнтирами (ALT)")
+    print("=" * 70)
+
+    landmark_index = LandmarkIndex.build(graph1, num_landmarks=2, seed=0)
+    landmark_names = [landmark_index.graph.names[i] for i in landmark_index.landmarks]
+    print(f"Орієнтири: {', '.join(landmark_names)}")
+    print(f"Нижня оцінка A → F: {landmark_index.lower_bound('A', 'F')}")
+    distance, path = landmark_index.query("A", "F")
+    print(f"A → F: відстань = {distance}, шлях: {' → '.join(path)}")
+
+    # Приклад 5: Ієрархія стягувань
+    print("\n" + "=" * 70)
+    print("ПРИКЛАД 5: Contraction hierarchies")
+    print("=" * 70)
+
+    hierarchy = ContractionHierarchy.build(graph1)
+    contraction_order = sorted(
+        hierarchy.graph.names,
+        key=lambda name: hierarchy.rank[hierarchy.graph.ids[name]],
+    )
+    print(f"Порядок стягування: {', '.join(contraction_order)}")
+    print(f"Додано ярликів: {hierarchy.shortcuts}")
+    distance, path = hierarchy.query("A", "F")
+    print(f"A → F: відстань = {distance}, шлях: {' → '.join(path)}")
+
+    # Приклад 6: Матриця відстаней від кількох джерел
+    print("\n" + "=" * 70)
+    print("ПРИКЛАД 6: dijkstra_many - матриця відстаней")
+    print("=" * 70)
+
+    matrix = dijkstra_many(graph1, ["A", "F"], workers=2)
+    print("     " + "".join(f"{name:>6}" for name in frozen1.names))
+    for name, row in zip(["A", "F"], matrix):
+        print(f"{name:<5}" + "".join(f"{value:>6.0f}" for value in row))
+
+    # Приклад 7: Кеш дерев найкоротших шляхів
+    print("\n" + "=" * 70)
+    print("ПРИКЛАД 7: ShortestPathCache")
+    print("=" * 70)
+
+    graph7 = create_example_graph1()
+    cache = ShortestPathCache(graph7, max_size=2)
+    for source, target in (("A", "F"), ("A", "D"), ("F", "A"), ("B", "E")):
+        distance, path = cache.path(source, target)
+        print(f"{source} → {target}: відстань = {distance}, шлях: {' → '.join(path)}")
+    graph7.add_edge("A", "F", 20)  # Нічого не покращує - записи залишаються
+    graph7.add_edge("A", "E", 1)  # Скорочує шляхи - записи видаляються
+    print(
+        f"Влучань: {cache.hits}, промахів: {cache.misses}, "
+        f"витіснень: {cache.evictions}, інвалідацій: {cache.invalidations}"
+    )
+
+    # Приклад 8: Динамічне оновлення дерева найкоротших шляхів
+    print("\n" + "=" * 70)
+    print("ПРИКЛАД 8: DynamicSSSP")
+    print("=" * 70)
+
+    graph8 = create_example_graph1()
+    dynamic = DynamicSSSP(graph8, "A")
+    for title, change in (
+        ("Вага B - D: 5 → 9", lambda: graph8.set_edge_weight("B", "D", 9)),
+        ("Вага C - E: 10 → 3", lambda: graph8.set_edge_weight("C", "E", 3)),
+        ("Видалення ребра C - E", lambda: graph8.remove_edge("C", "E")),
+        ("Нове ребро A - F вагою 7", lambda: graph8.add_edge("A", "F", 7)),
+    ):
+        change()
+        distance, path = dynamic.path("F")
+        print(
+            f"{title}: A → F = {distance}, шлях: {' → '.join(path)} "
+            f"(оброблено вершин: {dynamic.touched})"
+        )
+
+    # Приклад 9: Завантаження орієнтованого графа з файлу DIMACS
+    print("\n" + "=" * 70)
+    print("ПРИКЛАД 9: Завантаження графа з файлу DIMACS")
+    print("=" * 70)
+
+    with tempfile.TemporaryDirectory(prefix="graph-") as directory:
+        dimacs_path = os.path.join(directory, "example.gr")
+        with open(dimacs_path, "w", encoding="utf-8") as file:
+            file.write("c орієнтований граф\np sp 4 5\n")
+            file.write("a 1 2 1\na 2 3 1\na 3 4 1\na 4 1 1\na 1 3 5\n")
+        graph9 = load_dimacs(dimacs_path, frozen=True, verbose=True)
+
+    for source, target in (("1", "4"), ("4", "1")):
+        distance, path = shortest_path(graph9, source, target, bidirectional=True)
+        print(f"{source} → {target}: відстань = {distance}, шлях: {' → '.join(path)}")